@@ -1,114 +1,275 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import argparse
+from contextlib import contextmanager
+import os
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
-from pages_db import (
-    EXPECTED_HEADER,
-    ParseError,
-    ParseLimits,
-    ParseResult,
-    format_header_error,
-    parse_dump,
-)
-from pages_focus import FocusEntry, load_focus_list
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Callable, Iterator
+
+    from pages_db import ParseResult, ParseStats
+    from pages_focus import FocusEntry
+
+
+_WARNING_COUNT = "Warning: %s: %d"
+_WARNING_COUNT_IN = "Warning: %s: %d in %s"
+_INFO_COUNT = "Info: %s: %d"
+_INFO_COUNT_IN = "Info: %s: %d in %s"
+
+
+def _write_stderr(message: str) -> None:
+    # Look sys.stderr up per call so redirect_stderr and test captures still apply.
+    sys.stderr.write(message + "\n")
+
+
+def _emit(message: str, messages: list[str] | None) -> None:
+    if messages is None:
+        _write_stderr(message)
+        return
+    messages.append(message)
+
+
+def flush_messages(messages: list[str]) -> None:
+    if not messages:
+        return
+    _write_stderr("\n".join(messages))
+    messages.clear()
 
 
-def warn_count(label: str, count: int, *, path: Path | None = None) -> None:
+def warn_count(
+    label: str,
+    count: int,
+    *,
+    path: str | Path | None = None,
+    messages: list[str] | None = None,
+) -> None:
     if not count:
         return
     if path is None:
-        message = f"Warning: {label}: {count}"
+        message = _WARNING_COUNT % (label, count)
     else:
-        message = f"Warning: {label}: {count} in {path}"
-    print(message, file=sys.stderr)
+        message = _WARNING_COUNT_IN % (label, count, path)
+    _emit(message, messages)
 
 
-def info_count(label: str, count: int, *, path: Path | None = None) -> None:
+def info_count(
+    label: str,
+    count: int,
+    *,
+    path: str | Path | None = None,
+    messages: list[str] | None = None,
+) -> None:
     if not count:
         return
     if path is None:
-        message = f"Info: {label}: {count}"
+        message = _INFO_COUNT % (label, count)
     else:
-        message = f"Info: {label}: {count} in {path}"
-    print(message, file=sys.stderr)
-
-
-def warn(message: str) -> None:
-    print(f"Warning: {message}", file=sys.stderr)
+        message = _INFO_COUNT_IN % (label, count, path)
+    _emit(message, messages)
 
 
-def info(message: str) -> None:
-    print(f"Info: {message}", file=sys.stderr)
+def warn(message: str, *, messages: list[str] | None = None) -> None:
+    _emit(f"Warning: {message}", messages)
 
 
-def info_page_count(label: str, count: int, page_name: str) -> None:
+def info_page_count(
+    label: str,
+    count: int,
+    page_name: str,
+    *,
+    messages: list[str] | None = None,
+) -> None:
     if not count:
         return
-    info(f"{label}: {count} in page '{page_name}'")
+    _emit(f"Info: {label}: {count} in page '{page_name}'", messages)
 
 
 def error(message: str) -> None:
-    print(f"Error: {message}", file=sys.stderr)
+    _write_stderr("Error: " + message)
+
+
+_ArgSpec = tuple[tuple[str, ...], dict[str, object]]
+
+# Option specs are built once at import; the add_* helpers only replay them
+# (per-call values such as prefix/case defaults are merged in as overrides).
+_STANDARD_ARG_SPECS: tuple[_ArgSpec, ...] = (
+    (
+        ("--input",),
+        {"default": "db.out", "help": "Path to mysql tab dump (default: db.out)."},
+    ),
+    (
+        ("--output-dir",),
+        {
+            "help": "Directory to write output files (default: current directory for writers).",
+        },
+    ),
+    (
+        ("--lines",),
+        {"type": int, "default": 1000, "help": "Max data lines to read (0 for unlimited)."},
+    ),
+    (
+        ("--bytes",),
+        {
+            "dest": "max_bytes",
+            "type": int,
+            "default": 1_000_000,
+            "help": "Max bytes per data line (0 for unlimited).",
+        },
+    ),
+    (
+        ("--csvin",),
+        {
+            "dest": "csvin",
+            "action": "store_true",
+            "help": "Parse the dump with csv.reader (tab delimiter, backslash escapes).",
+        },
+    ),
+    (
+        ("--json-warnings",),
+        {
+            "action": "store_true",
+            "help": "Report dump parse counts as one JSON object on stderr instead of Info/Warning lines.",
+        },
+    ),
+    (
+        ("--permit",),
+        {
+            "action": "store_true",
+            "default": False,
+            "help": "Allow header mismatch and malformed rows (equivalent to --permit-header --permit-columns).",
+        },
+    ),
+    (
+        ("--permit-header",),
+        {
+            "dest": "strict_header",
+            "action": "store_false",
+            "default": True,
+            "help": "Allow header column names to differ from expected names (default: strict).",
+        },
+    ),
+    (
+        ("--permit-columns",),
+        {
+            "dest": "strict_columns",
+            "action": "store_false",
+            "default": True,
+            "help": "Allow malformed rows; skip and count them (default: strict).",
+        },
+    ),
+)
 
+_PAGES_ARG_SPECS: tuple[_ArgSpec, ...] = (
+    (
+        ("--pages",),
+        {"default": "pages.list", "help": "Path to pages list file (default: pages.list)."},
+    ),
+    (("--prefix",), {"dest": "use_prefix", "action": "store_true"}),
+    (
+        ("--noprefix",),
+        {"dest": "use_prefix", "action": "store_false", "help": "Disable prefix matching."},
+    ),
+    (("--case",), {"dest": "case_sensitive", "action": "store_true"}),
+    (
+        ("--nocase",),
+        {
+            "dest": "case_sensitive",
+            "action": "store_false",
+            "help": "Use case-insensitive matching.",
+        },
+    ),
+)
+
+_DUMP_ARG_SPECS: tuple[_ArgSpec, ...] = (
+    (
+        ("--rows",),
+        {
+            "dest": "dump_rows",
+            "help": "Dump rows (raw row values) to numbered .txt files under DIR.",
+        },
+    ),
+    (
+        ("--notags",),
+        {
+            "action": "store_true",
+            "help": "Write <Page>_notags.txt dump notags after tag stripping.",
+        },
+    ),
+)
+
+_JOBS_ARG_SPECS: tuple[_ArgSpec, ...] = (
+    (
+        ("--jobs",),
+        {
+            "type": int,
+            "default": 1,
+            "help": "Render pages in N worker processes (default: 1; 0 uses all CPUs).",
+        },
+    ),
+)
+
+_FILTER_ARG_SPECS: tuple[_ArgSpec, ...] = (
+    (
+        ("--replace",),
+        {
+            "dest": "replace_char",
+            "nargs": "?",
+            "const": "",
+            "default": None,
+            "help": (
+                "Replace suspicious characters (default: space). "
+                "Provide a single ASCII character (0x21-0x7E). "
+                "Use --replace with no value to delete instead."
+            ),
+        },
+    ),
+    (
+        ("--raw",),
+        {
+            "action": "store_true",
+            "help": "Disable character filtering (control/zero-width/non-ASCII).",
+        },
+    ),
+    (
+        ("--utf",),
+        {
+            "action": "store_true",
+            "help": "Allow Unicode characters (do not drop bytes >= 0x7F).",
+        },
+    ),
+    (
+        ("--notab",),
+        {"action": "store_true", "help": "Disallow tab characters in output."},
+    ),
+    (
+        ("--nonl",),
+        {"action": "store_true", "help": "Disallow newline characters in output."},
+    ),
+)
 
-def warn_if(condition: bool, message: str) -> None:
-    if not condition:
-        return
-    warn(message)
+
+def _add_arg_specs(
+    parser: argparse.ArgumentParser,
+    specs: tuple[_ArgSpec, ...],
+    overrides: dict[str, dict[str, object]] | None = None,
+) -> None:
+    for flags, kwargs in specs:
+        if overrides and flags[0] in overrides:
+            kwargs = {**kwargs, **overrides[flags[0]]}
+        parser.add_argument(*flags, **kwargs)
 
 
 def add_standard_args(parser: argparse.ArgumentParser) -> None:
-    parser.add_argument(
-        "--input",
-        default="db.out",
-        help="Path to mysql tab dump (default: db.out).",
-    )
-    parser.add_argument(
-        "--output-dir",
-        default=argparse.SUPPRESS,
-        help="Directory to write output files (default: current directory for writers).",
-    )
-    parser.add_argument(
-        "--lines",
-        type=int,
-        default=1000,
-        help="Max data lines to read (0 for unlimited).",
-    )
-    parser.add_argument(
-        "--bytes",
-        dest="max_bytes",
-        type=int,
-        default=1_000_000,
-        help="Max bytes per data line (0 for unlimited).",
-    )
-    parser.add_argument(
-        "--csvin",
-        dest="csvin",
-        action="store_true",
-        help="Parse the dump with csv.reader (tab delimiter, backslash escapes).",
-    )
-    parser.add_argument(
-        "--permit",
-        action="store_true",
-        default=False,
-        help="Allow header mismatch and malformed rows (equivalent to --permit-header --permit-columns).",
-    )
-    parser.add_argument(
-        "--permit-header",
-        dest="strict_header",
-        action="store_false",
-        default=True,
-        help="Allow header column names to differ from expected names (default: strict).",
-    )
-    parser.add_argument(
-        "--permit-columns",
-        dest="strict_columns",
-        action="store_false",
-        default=True,
-        help="Allow malformed rows; skip and count them (default: strict).",
+    import argparse
+
+    _add_arg_specs(
+        parser,
+        _STANDARD_ARG_SPECS,
+        {"--output-dir": {"default": argparse.SUPPRESS}},
     )
 
 
@@ -120,36 +281,13 @@ def add_pages_args(
     prefix_help: str,
     case_help: str,
 ) -> None:
-    parser.add_argument(
-        "--pages",
-        default="pages.list",
-        help="Path to pages list file (default: pages.list).",
-    )
-    parser.add_argument(
-        "--prefix",
-        dest="use_prefix",
-        action="store_true",
-        default=prefix_default,
-        help=prefix_help,
-    )
-    parser.add_argument(
-        "--noprefix",
-        dest="use_prefix",
-        action="store_false",
-        help="Disable prefix matching.",
-    )
-    parser.add_argument(
-        "--case",
-        dest="case_sensitive",
-        action="store_true",
-        default=case_default,
-        help=case_help,
-    )
-    parser.add_argument(
-        "--nocase",
-        dest="case_sensitive",
-        action="store_false",
-        help="Use case-insensitive matching.",
+    _add_arg_specs(
+        parser,
+        _PAGES_ARG_SPECS,
+        {
+            "--prefix": {"default": prefix_default, "help": prefix_help},
+            "--case": {"default": case_default, "help": case_help},
+        },
     )
 
 
@@ -176,52 +314,19 @@ def add_dump_args(
     *,
     include_notags: bool = False,
 ) -> None:
-    parser.add_argument(
-        "--rows",
-        dest="dump_rows",
-        help="Dump rows (raw row values) to numbered .txt files under DIR.",
-    )
-    if include_notags:
-        parser.add_argument(
-            "--notags",
-            action="store_true",
-            help="Write <Page>_notags.txt dump notags after tag stripping.",
-        )
+    _add_arg_specs(parser, _DUMP_ARG_SPECS if include_notags else _DUMP_ARG_SPECS[:1])
 
 
 def add_filter_args(parser: argparse.ArgumentParser) -> None:
-    parser.add_argument(
-        "--replace",
-        dest="replace_char",
-        nargs="?",
-        const="",
-        default=None,
-        help=(
-            "Replace suspicious characters (default: space). "
-            "Provide a single ASCII character (0x21-0x7E). "
-            "Use --replace with no value to delete instead."
-        ),
-    )
-    parser.add_argument(
-        "--raw",
-        action="store_true",
-        help="Disable character filtering (control/zero-width/non-ASCII).",
-    )
-    parser.add_argument(
-        "--utf",
-        action="store_true",
-        help="Allow Unicode characters (do not drop bytes >= 0x7F).",
-    )
-    parser.add_argument(
-        "--notab",
-        action="store_true",
-        help="Disallow tab characters in output.",
-    )
-    parser.add_argument(
-        "--nonl",
-        action="store_true",
-        help="Disallow newline characters in output.",
-    )
+    _add_arg_specs(parser, _FILTER_ARG_SPECS)
+
+
+def add_jobs_args(parser: argparse.ArgumentParser) -> None:
+    _add_arg_specs(parser, _JOBS_ARG_SPECS)
+
+
+_JOBS_PER_CPU = 4
+_REPLACE_CHARS = frozenset(chr(code) for code in range(0x21, 0x7F))
 
 
 def _validate_replace_char(value: str) -> str | None:
@@ -230,8 +335,7 @@ def _validate_replace_char(value: str) -> str | None:
     if len(value) != 1:
         error("--replace must be a single ASCII character.")
         return None
-    code = ord(value)
-    if code <= 0x20 or code >= 0x7F:
+    if value not in _REPLACE_CHARS:
         error("--replace must be a printable ASCII character (0x21-0x7E).")
         return None
     return value
@@ -267,31 +371,81 @@ def validate_limits(lines: int, max_bytes: int) -> bool:
     return True
 
 
-def load_focus_entries(path: Path, case_sensitive: bool) -> list[FocusEntry] | None:
-    if not path.exists():
-        error(f"pages list file not found: {path}")
-        return None
+def validate_jobs(jobs: int) -> bool:
+    if jobs < 0:
+        error("--jobs must be 0 or a positive integer.")
+        return False
+    max_jobs = _JOBS_PER_CPU * (os.cpu_count() or 1)
+    if jobs > max_jobs:
+        error(f"--jobs must be at most {max_jobs} ({_JOBS_PER_CPU} per CPU).")
+        return False
+    return True
+
+
+def pool_size(jobs: int, task_count: int) -> int:
+    # Never start more workers than there are tasks to hand them.
+    return max(1, min(jobs or os.cpu_count() or 1, task_count))
+
+
+@contextmanager
+def map_jobs(
+    func: Callable[[object], object],
+    tasks: list[object],
+    jobs: int,
+) -> Iterator[Iterator[object]]:
+    # Results come back in task order; func and tasks must be picklable for jobs != 1.
+    if jobs == 1 or len(tasks) < 2:
+        yield map(func, tasks)
+        return
+    import multiprocessing
+
+    processes = pool_size(jobs, len(tasks))
+    # Hand out tasks in chunks so small pages are not dominated by per-task IPC.
+    chunksize = max(1, len(tasks) // (processes * 4))
+    pool = multiprocessing.Pool(processes)
+    try:
+        yield pool.imap(func, tasks, chunksize)
+    finally:
+        pool.terminate()
+
+
+def load_focus_entries(
+    path: str | Path, case_sensitive: bool
+) -> list[FocusEntry] | None:
+    from pages_focus import load_focus_list
+
+    path = os.fspath(path)
     try:
         result = load_focus_list(path, case_sensitive)
+    except FileNotFoundError:
+        error(f"pages list file not found: {path}")
+        return None
     except OSError as exc:
         error(f"pages list could not be read: {path} ({exc})")
         return None
-    for name in result.duplicates:
-        warn(f"Duplicate page name skipped: {name}")
+    if result.duplicates:
+        messages: list[str] = []
+        for name in result.duplicates:
+            warn(f"Duplicate page name skipped: {name}", messages=messages)
+        flush_messages(messages)
     return result.entries
 
 
 def parse_dump_check(
-    input_path: Path,
+    input_path: str | Path,
     *,
     max_lines: int,
     max_bytes: int,
     use_csv: bool,
     include_content: bool,
+    keep_content: Callable[[str], bool] | None = None,
     strict_header: bool = True,
     strict_columns: bool = True,
     dump_rows_dir: Path | None = None,
 ) -> ParseResult | None:
+    from pages_db import ParseError, ParseLimits, parse_dump
+
+    input_path = os.fspath(input_path)
     limits = ParseLimits(max_lines=max_lines, max_bytes=max_bytes)
     try:
         return parse_dump(
@@ -301,6 +455,7 @@ def parse_dump_check(
             strict_columns=strict_columns,
             use_csv=use_csv,
             include_content=include_content,
+            keep_content=keep_content,
             dump_rows_dir=dump_rows_dir,
         )
     except FileNotFoundError:
@@ -314,26 +469,104 @@ def parse_dump_check(
         return None
 
 
+def resolve_strict(args: argparse.Namespace) -> tuple[bool, bool]:
+    if args.permit:
+        return False, False
+    return args.strict_header, args.strict_columns
+
+
+def load_dump(
+    args: argparse.Namespace,
+    *,
+    include_content: bool,
+    keep_content: Callable[[str], bool] | None = None,
+) -> ParseResult | None:
+    strict_header, strict_columns = resolve_strict(args)
+    input_path = os.fspath(args.input)
+    dump_rows_dir = Path(args.dump_rows) if args.dump_rows else None
+    result = parse_dump_check(
+        input_path,
+        max_lines=args.lines,
+        max_bytes=args.max_bytes,
+        use_csv=args.csvin,
+        include_content=include_content,
+        keep_content=keep_content,
+        strict_header=strict_header,
+        strict_columns=strict_columns,
+        dump_rows_dir=dump_rows_dir,
+    )
+    if result is None:
+        return None
+    emit_db_warnings(
+        result,
+        input_path,
+        strict_header=strict_header,
+        strict_columns=strict_columns,
+        json_warnings=args.json_warnings,
+    )
+    return result
+
+
 def emit_db_warnings(
     result: ParseResult,
-    input_path: Path,
+    input_path: str | Path,
     *,
     strict_header: bool,
     strict_columns: bool,
+    json_warnings: bool = False,
 ) -> None:
-    info_count("Oversized line count", result.stats.skipped_oversized, path=input_path)
+    stats = result.stats
+    if json_warnings:
+        _emit_db_warnings_json(stats, os.fspath(input_path))
+        return
+    if stats.is_clean():
+        return
+    input_path = os.fspath(input_path)
+    messages: list[str] = []
+    info_count(
+        "Oversized line count",
+        stats.skipped_oversized,
+        path=input_path,
+        messages=messages,
+    )
     if not strict_columns:
-        info_count("Malformed row count", result.stats.skipped_malformed, path=input_path)
-    if not strict_header:
-        warn_if(
-            result.stats.header_mismatch,
-            format_header_error(input_path, result.stats.header_columns, EXPECTED_HEADER),
+        info_count(
+            "Malformed row count",
+            stats.skipped_malformed,
+            path=input_path,
+            messages=messages,
+        )
+    if not strict_header and stats.header_mismatch:
+        from pages_db import EXPECTED_HEADER, format_header_error
+
+        warn(
+            format_header_error(input_path, stats.header_columns, EXPECTED_HEADER),
+            messages=messages,
         )
-    info_count("Invalid id count", result.stats.invalid_id_count)
-    info_count("Duplicate id count", result.stats.duplicate_id_count)
-    info_count("Unknown status count", result.stats.unknown_status_count)
-    info_count("Invalid date count", result.stats.invalid_date_count)
-    warn_if(
-        result.stats.reached_limit,
-        f"Line limit reached at line {result.stats.read_lines}.",
+    info_count("Invalid id count", stats.invalid_id_count, messages=messages)
+    info_count("Duplicate id count", stats.duplicate_id_count, messages=messages)
+    info_count(
+        "Unknown status count", stats.unknown_status_count, messages=messages
     )
+    info_count("Invalid date count", stats.invalid_date_count, messages=messages)
+    if stats.reached_limit:
+        warn(f"Line limit reached at line {stats.read_lines}.", messages=messages)
+    flush_messages(messages)
+
+
+def _emit_db_warnings_json(stats: ParseStats, input_path: str) -> None:
+    import json
+
+    report = {
+        "input": input_path,
+        "read_lines": stats.read_lines,
+        "oversized": stats.skipped_oversized,
+        "malformed": stats.skipped_malformed,
+        "header_mismatch": stats.header_mismatch,
+        "invalid_id": stats.invalid_id_count,
+        "duplicate_id": stats.duplicate_id_count,
+        "unknown_status": stats.unknown_status_count,
+        "invalid_date": stats.invalid_date_count,
+        "reached_limit": stats.reached_limit,
+    }
+    _write_stderr(json.dumps(report))
@@ -2,19 +2,25 @@
 import argparse
 import html
 import re
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterator
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import NamedTuple
 
 from pages_cli import (
     add_common_args,
     add_dump_args,
     add_filter_args,
-    emit_db_warnings,
+    add_jobs_args,
     error,
+    flush_messages,
     info_page_count,
+    load_dump,
     load_focus_entries,
-    parse_dump_check,
+    map_jobs,
     resolve_filter_args,
+    validate_jobs,
     validate_limits,
     warn,
 )
@@ -24,16 +30,65 @@ from pages_util import (
     SanitizeCounts,
     decode_mysql_escapes,
     filter_characters,
-    make_dump_notags_sink,
     prepare_output_dir,
     write_text_check,
     safe_filename,
     strip_footer,
 )
-from pages_focus import match_entries
+from pages_focus import FocusMatch, content_filter, match_entries
 
 ANCHOR_RE = re.compile(r"(?is)<a\b([^>]*)>(.*?)</a>")
 IMG_RE = re.compile(r"(?is)<img\b[^>]*>")
+SCRIPT_STYLE_RE = re.compile(r"(?is)<(script|style)[^>]*>.*?</\1>")
+COMMENT_RE = re.compile(r"(?s)<!--.*?-->")
+ALL_TAGS_RE = re.compile(r"(?s)<[^>]+>")
+SCHEME_RE = re.compile(r"(?i)^\s*([a-z][a-z0-9+.-]*):")
+OL_BLOCK_RE = re.compile(r"(?is)<ol\b[^>]*>(.*?)</ol\s*>")
+OL_CLOSE_RE = re.compile(r"(?i)</ol\s*>")
+OL_ITEM_OPEN_RE = re.compile(r"(?i)<li\b[^>]*>")
+OL_ITEM_CLOSE_RE = re.compile(r"(?i)</li\s*>")
+WS_RUN_RE = re.compile(r"[ \t]+")
+BR_RE = re.compile(r"(?i)<br\s*/?>")
+H_OPEN_RE = re.compile(r"(?i)<h([1-6])[^>]*>")
+H_CLOSE_RE = re.compile(r"(?i)</h[1-6]>")
+LI_OPEN_RE = re.compile(r"(?i)<li[^>]*>")
+LI_CLOSE_RE = re.compile(r"(?i)</li>")
+UL_OL_RE = re.compile(r"(?i)</?(ul|ol)[^>]*>")
+BLANK_DASH_RE = re.compile(r"\n{2,}- ")
+TR_OPEN_RE = re.compile(r"(?i)<tr[^>]*>")
+TR_CLOSE_RE = re.compile(r"(?i)</tr>")
+TDH_OPEN_RE = re.compile(r"(?i)<t[dh][^>]*>")
+TDH_CLOSE_RE = re.compile(r"(?i)</t[dh]>")
+TABLE_WRAP_RE = re.compile(r"(?i)</?(table|thead|tbody|tfoot)[^>]*>")
+BLOCK_TAGS_RE = re.compile(
+    r"(?i)</?(p|div|section|article|header|footer|blockquote|figure|figcaption"
+    r"|form|label|input|textarea|button|pre|code|hr)[^>]*>"
+)
+ENTITY_RE = re.compile(r"&[A-Za-z0-9#]+;")
+# Open/close pairs that share a replacement run as one alternation.  The close
+# alternative has no [^>]* run, so it cannot overlap an open match and the single
+# pass gives the same result as the former open-then-close passes.
+PRE_CODE_RE = re.compile(
+    r"(?is)<pre\b[^>]*>\s*<code\b[^>]*>|</code\s*>\s*</pre\s*>"
+)
+PRE_RE = re.compile(r"(?is)<pre\b[^>]*>|</pre\s*>")
+STRONG_RE = re.compile(r"(?i)<(?:strong|b)\b[^>]*>|</(?:strong|b)\s*>")
+EM_RE = re.compile(r"(?i)<(?:em|i)\b[^>]*>|</(?:em|i)\s*>")
+CODE_RE = re.compile(r"(?i)<code\b[^>]*>|</code\s*>")
+PARA_RE = re.compile(r"(?i)<p[^>]*>|</p>")
+TR_RE = re.compile(r"(?i)<tr[^>]*>|</tr>")
+MD_BLOCK_TAGS_RE = re.compile(
+    r"(?i)</?(div|section|article|header|footer|blockquote|figure|figcaption)[^>]*>"
+)
+TABLE_LEAD_PIPE_RE = re.compile(r"\n\s*\|\s*")
+ORDERED_MARKER_RE = re.compile(r"\d+\.")
+HEADING_MARKER_RE = re.compile(r"#{1,6}")
+PAREN_LINK_RE = re.compile(r"\)\s*(?=[!\[])")
+PAREN_WORD_RE = re.compile(r"\)\s*(?=[A-Za-z0-9])")
+PAREN_BRACE_RE = re.compile(r"\)\s*(?=\{)")
+PAREN_TEXT_RE = re.compile(r"\)\s*(?=[A-Za-z0-9\[{])")
+ORDERED_ITEM_RE = re.compile(r"^\d+\.\s+")
+HEADING_PREFIXES = {str(level): f"\n{'#' * level} " for level in range(1, 7)}
 HTTP_SCHEMES = {"http", "https"}
 BIDI_CONTROLS = {
     "\u200e",
@@ -49,39 +104,40 @@ BIDI_CONTROLS = {
     "\u2069",
 }
 ZERO_WIDTH = {"\u200b", "\u200c", "\u200d", "\ufeff"}
+# Whitespace (no str.isspace() code point lies above U+3000), C0 controls, DEL,
+# zero-width, and bidi controls are dropped from link and image URLs.
+URL_STRIP_TABLE = dict.fromkeys(
+    [code for code in range(0x3001) if chr(code).isspace() or code < 0x20]
+    + [0x7F]
+    + [ord(ch) for ch in ZERO_WIDTH | BIDI_CONTROLS]
+)
 LIST_TAGS = ("ul", "ol", "li")
 TABLE_TAGS = ("table", "tr", "td", "th")
+STRUCTURE_OPEN_RE = re.compile(r"(?i)<(ul|ol|li|table|tr|td|th)\b([^>]*)>")
+STRUCTURE_CLOSE_RE = re.compile(r"(?i)</(ul|ol|li|table|tr|td|th)\s*>")
+TAG_OPEN_RES = {
+    tag: re.compile(rf"(?i)<{tag}\b[^>]*>") for tag in LIST_TAGS + TABLE_TAGS
+}
+UNESCAPE_CACHE_MAX_LEN = 256
+ATTR_RE = re.compile(r'''([^\s"'<>/=]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^"'>\s]+))''')
 
 
-def _extract_attr(tag: str, name: str) -> str:
-    pattern = rf'(?i)\b{name}\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^"\'>\s]+))'
-    match = re.search(pattern, tag)
-    if not match:
-        return ""
-    for group in match.groups():
-        if group is not None:
-            return group.strip()
-    return ""
+def _parse_attrs(tag: str) -> dict[str, str]:
+    # One scan per tag; the first occurrence of a repeated attribute wins.
+    attrs: dict[str, str] = {}
+    for match in ATTR_RE.finditer(tag):
+        attrs.setdefault(match.group(1).lower(), match.group(match.lastindex).strip())
+    return attrs
 
 
 def _suppress_url_chars(url: str) -> str:
     if not url:
         return ""
-    cleaned: list[str] = []
-    for ch in url:
-        if ch.isspace():
-            continue
-        code = ord(ch)
-        if code < 0x20 or code == 0x7F:
-            continue
-        if ch in ZERO_WIDTH or ch in BIDI_CONTROLS:
-            continue
-        cleaned.append(ch)
-    return "".join(cleaned)
+    return url.translate(URL_STRIP_TABLE)
 
 
 def _get_scheme(url: str) -> str:
-    match = re.match(r"(?i)^\s*([a-z][a-z0-9+.-]*):", url)
+    match = SCHEME_RE.match(url)
     if not match:
         return ""
     return match.group(1).lower()
@@ -122,24 +178,37 @@ def _format_scheme_relative(
     return _format_missing_scheme(label, url, title)
 
 
-def _count_tags(text: str, tag: str) -> tuple[int, int]:
-    open_count = len(re.findall(rf"(?i)<{tag}\b[^>]*>", text))
-    close_count = len(re.findall(rf"(?i)</{tag}\s*>", text))
-    return open_count, close_count
+def _count_structure_tags(text: str) -> tuple[Counter[str], Counter[str]]:
+    closes = Counter(map(str.lower, STRUCTURE_CLOSE_RE.findall(text)))
+    found = STRUCTURE_OPEN_RE.findall(text)
+    if not found:
+        return Counter(), closes
+    names, attrs = zip(*found)
+    if "<" in "".join(attrs):
+        # A "<" inside an open tag can hide another open tag from the combined
+        # scan, so count each tag on its own as the per-tag patterns would.
+        opens = Counter(
+            {tag: len(open_re.findall(text)) for tag, open_re in TAG_OPEN_RES.items()}
+        )
+        return opens, closes
+    return Counter(map(str.lower, names)), closes
 
 
 def _structure_warnings(text: str) -> list[str]:
+    if "<" not in text:
+        return []
     warnings: list[str] = []
+    opens, closes = _count_structure_tags(text)
     list_details: list[str] = []
     for tag in LIST_TAGS:
-        open_count, close_count = _count_tags(text, tag)
+        open_count, close_count = opens[tag], closes[tag]
         if open_count != close_count:
             list_details.append(f"<{tag}> {open_count} != </{tag}> {close_count}")
     if list_details:
         warnings.append("Malformed list structure: " + "; ".join(list_details))
     table_details: list[str] = []
     for tag in TABLE_TAGS:
-        open_count, close_count = _count_tags(text, tag)
+        open_count, close_count = opens[tag], closes[tag]
         if open_count != close_count:
             table_details.append(f"<{tag}> {open_count} != </{tag}> {close_count}")
     if table_details:
@@ -148,33 +217,67 @@ def _structure_warnings(text: str) -> list[str]:
 
 
 def _strip_inline_tags(text: str) -> str:
-    return re.sub(r"(?s)<[^>]+>", " ", text)
+    if "<" not in text:
+        return text
+    return ALL_TAGS_RE.sub(" ", text)
+
+
+def _heading_prefix(match: re.Match[str]) -> str:
+    return HEADING_PREFIXES[match.group(1)]
 
 
 def _strip_blocks_comments(text: str, counts: SanitizeCounts | None) -> str:
-    text, blocks_rm = re.subn(r"(?is)<(script|style)[^>]*>.*?</\1>", " ", text)
+    text, blocks_rm = SCRIPT_STYLE_RE.subn(" ", text)
     if counts is not None:
         counts.blocks_rm += blocks_rm
-    text, comments_rm = re.subn(r"(?s)<!--.*?-->", " ", text)
+    text, comments_rm = COMMENT_RE.subn(" ", text)
     if counts is not None:
         counts.comments_rm += comments_rm
     return text
 
 
+def _convert_anchors(
+    text: str, convert: Callable[[re.Match[str]], str]
+) -> tuple[str, int]:
+    # No match can run past the last closing tag; cutting there keeps unclosed
+    # <a> tags after it from each scanning to the end of the page.
+    end = max(text.rfind("</a>"), text.rfind("</A>"))
+    if end < 0:
+        return text, 0
+    end += len("</a>")
+    head, converted = ANCHOR_RE.subn(convert, text[:end])
+    return head + text[end:], converted
+
+
+@lru_cache(maxsize=4096)
+def _unescape_cached(value: str) -> str:
+    # Navigation and footer links repeat the same URLs and titles across a page.
+    return html.unescape(value)
+
+
+def _unescape(value: str) -> str:
+    # Long values are rarely repeated; decode them directly so the cache stays small.
+    if len(value) > UNESCAPE_CACHE_MAX_LEN:
+        return html.unescape(value)
+    return _unescape_cached(value)
+
+
 def _extract_anchor_parts(attrs: str, inner: str) -> tuple[str, str, str]:
-    url = html.unescape(_extract_attr(attrs, "href")).strip()
+    values = _parse_attrs(attrs)
+    url = _unescape(values.get("href", "")).strip()
     url = _suppress_url_chars(url)
     inner_text = _strip_inline_tags(inner)
     inner_text = html.unescape(inner_text).strip()
-    title = html.unescape(_extract_attr(attrs, "title")).strip()
+    title = _unescape(values.get("title", "")).strip()
     return url, inner_text, title
 
 
 def _extract_image_parts(tag: str) -> tuple[str, str, str]:
-    src = html.unescape(_extract_attr(tag, "src")).strip()
+    values = _parse_attrs(tag)
+    src = _unescape(values.get("src", "")).strip()
     src = _suppress_url_chars(src)
-    alt = html.unescape(_extract_attr(tag, "alt")).strip()
-    title = html.unescape(_extract_attr(tag, "title")).strip()
+    alt = _unescape(values.get("alt", "")).strip()
+    title = _unescape(values.get("title", "")).strip()
     return src, alt, title
 
 
@@ -303,16 +406,30 @@ def _number_ordered_lists(
             prefix = "\n" if count > 1 else ""
             return f"{prefix}{count}. "
 
-        body = re.sub(r"(?i)<li\b[^>]*>", replace_li, body)
-        body = re.sub(r"(?i)</li\s*>", "", body)
+        body = OL_ITEM_OPEN_RE.sub(replace_li, body)
+        body = OL_ITEM_CLOSE_RE.sub("", body)
         return "\n" + body + "\n"
 
-    result = re.sub(r"(?is)<ol\b[^>]*>(.*?)</ol\s*>", replace_block, text)
+    # No block can end past the last closing tag; cutting there keeps unclosed
+    # <ol> tags after it from each scanning to the end of the page.
+    start = max(text.rfind(close) for close in ("</ol", "</oL", "</Ol", "</OL"))
+    if start < 0:
+        return text
+    close = OL_CLOSE_RE.match(text, start)
+    end = close.end() if close else start
+    result = OL_BLOCK_RE.sub(replace_block, text[:end]) + text[end:]
     if counts is not None:
         counts.lists_conv += list_items
     return result
 
 
+def _collapse_ws(line: str) -> str:
+    # Most lines have no tab or double space; skip the regex for them.
+    if "\t" in line or "  " in line:
+        line = WS_RUN_RE.sub(" ", line)
+    return line.strip()
+
+
 def _normalize_lines(text: str, table_delim: str) -> str:
     lines = text.split("\n")
     lines = _merge_dangling_markers(lines)
@@ -322,13 +439,13 @@ def _normalize_lines(text: str, table_delim: str) -> str:
     for line in lines:
         if table_delim == "\t":
             parts = line.split("\t")
-            parts = [re.sub(r"[ \t]+", " ", part).strip() for part in parts]
+            parts = [_collapse_ws(part) for part in parts]
             parts = [
                 _separate_adjacent_inline(part, markdown=False) for part in parts
             ]
             line = "\t".join(parts)
         else:
-            line = re.sub(r"[ \t]+", " ", line).strip()
+            line = _collapse_ws(line)
             line = _separate_adjacent_inline(line, markdown=False)
         if table_delim and line.startswith(table_delim):
             line = line[len(table_delim) :]
@@ -361,7 +478,7 @@ def _normalize_markdown(text: str) -> str:
         if in_code:
             out_lines.append(line.rstrip())
             continue
-        line = re.sub(r"[ \t]+", " ", line).strip()
+        line = _collapse_ws(line)
         line = _separate_adjacent_inline(line, markdown=True)
         if not line:
             if not blank:
@@ -376,86 +493,104 @@ def _normalize_markdown(text: str) -> str:
     return cleaned
 
 
-def clean_content(
+def _convert_tags(
     text: str,
     *,
     table_delim: str,
-    replace_char: str,
-    keep_tabs: bool = True,
-    keep_newlines: bool = True,
-    ascii_only: bool = True,
-    raw: bool = False,
-    counts: SanitizeCounts | None = None,
-    filter_counts: FilterCounts | None = None,
-    notags_sink: Callable[[str], None] | None = None,
+    counts: SanitizeCounts | None,
 ) -> str:
-    if not text:
-        return ""
-    # Decode literal escape sequences from mysql -e output.
-    text = decode_mysql_escapes(text)
-
     # Remove scripts, styles, and comments to avoid inline code.
     text = _strip_blocks_comments(text, counts)
 
     # Preserve link destinations before stripping tags.
-    text, anchors_conv = ANCHOR_RE.subn(lambda m: _convert_anchor(m, counts), text)
+    text, anchors_conv = _convert_anchors(text, partial(_convert_anchor, counts=counts))
     if counts is not None:
         counts.anchors_conv += anchors_conv
 
     # Convert structural tags to line breaks or delimiters.
-    text, blocks_conv = re.subn(r"(?i)<br\s*/?>", "\n", text)
+    text, blocks_conv = BR_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text, headings_conv = re.subn(
-        r"(?i)<h([1-6])[^>]*>",
-        lambda m: f"\n{'#' * int(m.group(1))} ",
-        text,
-    )
+    text, headings_conv = H_OPEN_RE.subn(_heading_prefix, text)
     if counts is not None:
         counts.headings_conv += headings_conv
-    text, blocks_conv = re.subn(r"(?i)</h[1-6]>", "\n", text)
+    text, blocks_conv = H_CLOSE_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
     text = _number_ordered_lists(text, counts=counts)
-    text, lists_conv = re.subn(r"(?i)<li[^>]*>", "- ", text)
+    text, lists_conv = LI_OPEN_RE.subn("- ", text)
     if counts is not None:
         counts.lists_conv += lists_conv
-    text, blocks_conv = re.subn(r"(?i)</li>", "\n", text)
+    text, blocks_conv = LI_CLOSE_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(r"(?i)</?(ul|ol)[^>]*>", "\n", text)
+    text, blocks_conv = UL_OL_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text = re.sub(r"\n{2,}- ", "\n- ", text)
-    text = re.sub(r"(?i)<tr[^>]*>", "", text)
-    text, blocks_conv = re.subn(r"(?i)</tr>", "\n", text)
+    text = BLANK_DASH_RE.sub("\n- ", text)
+    text = TR_OPEN_RE.sub("", text)
+    text, blocks_conv = TR_CLOSE_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text, tables_conv = re.subn(r"(?i)<t[dh][^>]*>", table_delim, text)
+    text, tables_conv = TDH_OPEN_RE.subn(table_delim, text)
     if counts is not None:
         counts.tables_conv += tables_conv
-    text = re.sub(r"(?i)</t[dh]>", "", text)
-    text = re.sub(r"(?i)</?(table|thead|tbody|tfoot)[^>]*>", "", text)
-    text, blocks_conv = re.subn(
-        r"(?i)</?(p|div|section|article|header|footer|blockquote|figure|figcaption|form|label|input|textarea|button|pre|code|hr)[^>]*>",
+    text = TDH_CLOSE_RE.sub("", text)
+    text = TABLE_WRAP_RE.sub("", text)
+    text, blocks_conv = BLOCK_TAGS_RE.subn(
         "\n",
         text,
     )
     if counts is not None:
         counts.blocks_conv += blocks_conv
+    return text
+
+
+def clean_content(
+    text: str,
+    *,
+    table_delim: str,
+    replace_char: str,
+    keep_tabs: bool = True,
+    keep_newlines: bool = True,
+    ascii_only: bool = True,
+    raw: bool = False,
+    counts: SanitizeCounts | None = None,
+    filter_counts: FilterCounts | None = None,
+    notags_sink: Callable[[str], None] | None = None,
+) -> str:
+    if not text:
+        return ""
+    if not text.strip(" \n" if keep_newlines else " "):
+        # Blank rows render to nothing and touch no counts; only the dump sees them.
+        if notags_sink is not None:
+            notags_sink(text)
+        return ""
+    # Decode literal escape sequences from mysql -e output.
+    text = decode_mysql_escapes(text)
+
+    if "<" in text:
+        text = _convert_tags(text, table_delim=table_delim, counts=counts)
+    else:
+        # Without tags only the list blank-line fixup can change the text.
+        text = BLANK_DASH_RE.sub("\n- ", text)
 
     # Strip all remaining tags.
-    text, tags_rm = re.subn(r"(?s)<[^>]+>", " ", text)
-    if counts is not None:
-        counts.tags_rm += tags_rm
+    if "<" in text:
+        text, tags_rm = ALL_TAGS_RE.subn(" ", text)
+        if counts is not None:
+            counts.tags_rm += tags_rm
     if notags_sink is not None:
         notags_sink(text)
 
     # Decode entities and normalize line endings.
-    if counts is not None:
-        counts.entities_rm += len(re.findall(r"&[A-Za-z0-9#]+;", text))
-    text = html.unescape(text).replace("\u00a0", " ")
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "&" in text:
+        if counts is not None:
+            counts.entities_rm += len(ENTITY_RE.findall(text))
+        text = html.unescape(text)
+    text = text.replace("\u00a0", " ")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Filter control, zero-width, and non-ASCII characters.
     if not raw:
@@ -471,72 +606,39 @@ def clean_content(
     return _normalize_lines(text, table_delim)
 
 
-def clean_md(
-    text: str,
-    *,
-    replace_char: str,
-    keep_tabs: bool = True,
-    keep_newlines: bool = True,
-    ascii_only: bool = True,
-    raw: bool = False,
-    counts: SanitizeCounts | None = None,
-    filter_counts: FilterCounts | None = None,
-    notags_sink: Callable[[str], None] | None = None,
-) -> str:
-    if not text:
-        return ""
-    # Decode literal escape sequences from mysql -e output.
-    text = decode_mysql_escapes(text)
-
+def _convert_tags_md(text: str, *, counts: SanitizeCounts | None) -> str:
     # Remove scripts, styles, and comments to avoid inline code.
     text = _strip_blocks_comments(text, counts)
 
     # Code blocks first.
-    text, blocks_conv = re.subn(r"(?is)<pre\b[^>]*>\s*<code\b[^>]*>", "\n```\n", text)
-    if counts is not None:
-        counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(r"(?is)</code\s*>\s*</pre\s*>", "\n```\n", text)
+    text, blocks_conv = PRE_CODE_RE.subn("\n```\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(r"(?is)<pre\b[^>]*>", "\n```\n", text)
-    if counts is not None:
-        counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(r"(?is)</pre\s*>", "\n```\n", text)
+    text, blocks_conv = PRE_RE.subn("\n```\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
 
     # Headings.
-    text, headings_conv = re.subn(
-        r"(?i)<h([1-6])[^>]*>",
-        lambda m: f"\n{'#' * int(m.group(1))} ",
-        text,
-    )
+    text, headings_conv = H_OPEN_RE.subn(_heading_prefix, text)
     if counts is not None:
         counts.headings_conv += headings_conv
-    text, blocks_conv = re.subn(r"(?i)</h[1-6]>", "\n\n", text)
+    text, blocks_conv = H_CLOSE_RE.subn("\n\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
 
     # Emphasis and inline code.
-    text = re.sub(r"(?i)<(?:strong|b)\b[^>]*>", "**", text)
-    text = re.sub(r"(?i)</(?:strong|b)\s*>", "**", text)
-    text = re.sub(r"(?i)<(?:em|i)\b[^>]*>", "*", text)
-    text = re.sub(r"(?i)</(?:em|i)\s*>", "*", text)
-    text = re.sub(r"(?i)<code\b[^>]*>", "`", text)
-    text = re.sub(r"(?i)</code\s*>", "`", text)
+    text = STRONG_RE.sub("**", text)
+    text = EM_RE.sub("*", text)
+    text = CODE_RE.sub("`", text)
 
     # Paragraphs and breaks.
-    text, blocks_conv = re.subn(r"(?i)<br\s*/?>", "\n", text)
+    text, blocks_conv = BR_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(r"(?i)<p[^>]*>", "\n\n", text)
+    text, blocks_conv = PARA_RE.subn("\n\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(r"(?i)</p>", "\n\n", text)
-    if counts is not None:
-        counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(
-        r"(?i)</?(div|section|article|header|footer|blockquote|figure|figcaption)[^>]*>",
+    text, blocks_conv = MD_BLOCK_TAGS_RE.subn(
         "\n\n",
         text,
     )
@@ -545,49 +647,81 @@ def clean_md(
 
     # Lists.
     text = _number_ordered_lists(text, counts=counts)
-    text, lists_conv = re.subn(r"(?i)<li[^>]*>", "\n- ", text)
+    text, lists_conv = LI_OPEN_RE.subn("\n- ", text)
     if counts is not None:
         counts.lists_conv += lists_conv
-    text = re.sub(r"(?i)</li>", "", text)
-    text, blocks_conv = re.subn(r"(?i)</?(ul|ol)[^>]*>", "\n", text)
+    text = LI_CLOSE_RE.sub("", text)
+    text, blocks_conv = UL_OL_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text = re.sub(r"\n{2,}- ", "\n- ", text)
+    text = BLANK_DASH_RE.sub("\n- ", text)
 
     # Tables.
-    text, blocks_conv = re.subn(r"(?i)<tr[^>]*>", "\n", text)
+    text, blocks_conv = TR_RE.subn("\n", text)
     if counts is not None:
         counts.blocks_conv += blocks_conv
-    text, blocks_conv = re.subn(r"(?i)</tr>", "\n", text)
-    if counts is not None:
-        counts.blocks_conv += blocks_conv
-    text, tables_conv = re.subn(r"(?i)<t[dh][^>]*>", " | ", text)
+    text, tables_conv = TDH_OPEN_RE.subn(" | ", text)
     if counts is not None:
         counts.tables_conv += tables_conv
-    text = re.sub(r"(?i)</t[dh]>", "", text)
-    text = re.sub(r"(?i)</?(table|thead|tbody|tfoot)[^>]*>", "\n", text)
-    text = re.sub(r"\n\s*\|\s*", "\n", text)
+    text = TDH_CLOSE_RE.sub("", text)
+    text = TABLE_WRAP_RE.sub("\n", text)
+    text = TABLE_LEAD_PIPE_RE.sub("\n", text)
 
     # Links and images.
-    text, images_conv = IMG_RE.subn(lambda m: _convert_image_md(m, counts), text)
+    text, images_conv = IMG_RE.subn(partial(_convert_image_md, counts=counts), text)
     if counts is not None:
         counts.images_conv += images_conv
-    text, anchors_conv = ANCHOR_RE.subn(lambda m: _convert_anchor_md(m, counts), text)
+    text, anchors_conv = _convert_anchors(text, partial(_convert_anchor_md, counts=counts))
     if counts is not None:
         counts.anchors_conv += anchors_conv
+    return text
+
+
+def clean_md(
+    text: str,
+    *,
+    replace_char: str,
+    keep_tabs: bool = True,
+    keep_newlines: bool = True,
+    ascii_only: bool = True,
+    raw: bool = False,
+    counts: SanitizeCounts | None = None,
+    filter_counts: FilterCounts | None = None,
+    notags_sink: Callable[[str], None] | None = None,
+) -> str:
+    if not text:
+        return ""
+    if not text.strip(" \n" if keep_newlines else " "):
+        # Blank rows render to nothing and touch no counts; only the dump sees them.
+        if notags_sink is not None:
+            notags_sink(text)
+        return ""
+    # Decode literal escape sequences from mysql -e output.
+    text = decode_mysql_escapes(text)
+
+    if "<" in text:
+        text = _convert_tags_md(text, counts=counts)
+    else:
+        # Without tags only the list and table line fixups can change the text.
+        text = BLANK_DASH_RE.sub("\n- ", text)
+        text = TABLE_LEAD_PIPE_RE.sub("\n", text)
 
     # Strip all remaining tags.
-    text, tags_rm = re.subn(r"(?s)<[^>]+>", " ", text)
-    if counts is not None:
-        counts.tags_rm += tags_rm
+    if "<" in text:
+        text, tags_rm = ALL_TAGS_RE.subn(" ", text)
+        if counts is not None:
+            counts.tags_rm += tags_rm
     if notags_sink is not None:
         notags_sink(text)
 
     # Decode entities and normalize line endings.
-    if counts is not None:
-        counts.entities_rm += len(re.findall(r"&[A-Za-z0-9#]+;", text))
-    text = html.unescape(text).replace("\u00a0", " ")
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "&" in text:
+        if counts is not None:
+            counts.entities_rm += len(ENTITY_RE.findall(text))
+        text = html.unescape(text)
+    text = text.replace("\u00a0", " ")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Filter control, zero-width, and non-ASCII characters.
     if not raw:
@@ -613,68 +747,74 @@ def _is_marker_line(text: str) -> bool:
     stripped = text.strip()
     if stripped == "-":
         return True
-    if re.fullmatch(r"\d+\.", stripped):
-        return True
-    if re.fullmatch(r"#{1,6}", stripped):
-        return True
+    # Only lines starting with a digit or '#' can be markers; skip the regexes otherwise.
+    lead = stripped[:1]
+    if lead.isdecimal():
+        return ORDERED_MARKER_RE.fullmatch(stripped) is not None
+    if lead == "#":
+        return HEADING_MARKER_RE.fullmatch(stripped) is not None
     return False
 
 
 def _merge_dangling_markers(lines: list[str]) -> list[str]:
     merged: list[str] = []
+    count = len(lines)
     idx = 0
-    while idx < len(lines):
+    while idx < count:
         line = lines[idx]
         stripped = line.strip()
         if _is_marker_line(stripped):
             jdx = idx + 1
-            while jdx < len(lines) and not lines[jdx].strip():
+            while jdx < count and not lines[jdx].strip():
                 jdx += 1
-            if jdx < len(lines):
+            if jdx < count:
                 next_line = lines[jdx].strip()
-                if next_line and not _is_marker_line(next_line):
+                if _is_marker_line(next_line):
+                    idx = jdx
+                else:
                     merged.append(f"{stripped} {next_line}")
                     idx = jdx + 1
-                    continue
-                if next_line and _is_marker_line(next_line):
-                    idx = jdx
-                    continue
             else:
                 idx += 1
-                continue
+            continue
         merged.append(line)
         idx += 1
     return merged
 
 
 def _separate_adjacent_inline(line: str, *, markdown: bool) -> str:
+    if ")" not in line:
+        return line
     if markdown:
         # Only separates adjacency after link/image closers; inline code adjacency is not handled.
-        line = re.sub(r"\)\s*(?=[!\[])", ") ", line)
-        line = re.sub(r"\)\s*(?=[A-Za-z0-9])", ") ", line)
-        line = re.sub(r"\)\s*(?=\{)", ") ", line)
+        line = PAREN_LINK_RE.sub(") ", line)
+        line = PAREN_WORD_RE.sub(") ", line)
+        line = PAREN_BRACE_RE.sub(") ", line)
     else:
-        line = re.sub(r"\)\s*(?=[A-Za-z0-9\[{])", ") ", line)
+        line = PAREN_TEXT_RE.sub(") ", line)
     return line
 
 
 def _drop_list_blank_lines(lines: list[str]) -> list[str]:
     cleaned: list[str] = []
+    count = len(lines)
     idx = 0
-    while idx < len(lines):
+    while idx < count:
         line = lines[idx]
-        if not line.strip():
-            prev_line = cleaned[-1] if cleaned else ""
-            jdx = idx + 1
-            while jdx < len(lines) and not lines[jdx].strip():
-                jdx += 1
-            if jdx < len(lines):
-                next_line = lines[jdx]
-                if _is_list_item_line(prev_line) and _is_list_item_line(next_line):
-                    idx = jdx
-                    continue
-        cleaned.append(line)
-        idx += 1
+        if line.strip():
+            cleaned.append(line)
+            idx += 1
+            continue
+        # Handle the whole blank run at once so long runs are scanned only once.
+        jdx = idx + 1
+        while jdx < count and not lines[jdx].strip():
+            jdx += 1
+        prev_line = cleaned[-1] if cleaned else ""
+        if not (
+            jdx < count and _is_list_item_line(prev_line) and _is_list_item_line(lines[jdx])
+        ):
+            cleaned.extend(lines[idx:jdx])
+        idx = jdx
     return cleaned
 
 
@@ -682,7 +822,185 @@ def _is_list_item_line(line: str) -> bool:
     stripped = line.lstrip()
     if stripped.startswith("- "):
         return True
-    return re.match(r"^\d+\.\s+", stripped) is not None
+    if not stripped[:1].isdecimal():
+        return False
+    return ORDERED_ITEM_RE.match(stripped) is not None
+
+
+class RenderOptions(NamedTuple):
+    table_delim: str
+    replace_char: str
+    keep_tabs: bool
+    keep_newlines: bool
+    ascii_only: bool
+    raw: bool
+    keep_footer: bool
+
+
+def _render_page(
+    task: tuple[str, str, bool, RenderOptions],
+) -> tuple[str, SanitizeCounts, FilterCounts, str | None]:
+    # Module-level and fed plain values so --jobs workers can pickle the task.
+    content, fmt, want_notags, options = task
+    counts = SanitizeCounts()
+    filter_counts = FilterCounts()
+    notags: list[str] = []
+    notags_sink = notags.append if want_notags else None
+    if fmt == "markdown":
+        cleaned = clean_md(
+            content,
+            replace_char=options.replace_char,
+            keep_tabs=options.keep_tabs,
+            keep_newlines=options.keep_newlines,
+            ascii_only=options.ascii_only,
+            raw=options.raw,
+            counts=counts,
+            filter_counts=filter_counts,
+            notags_sink=notags_sink,
+        )
+    else:
+        cleaned = clean_content(
+            content,
+            table_delim=options.table_delim,
+            replace_char=options.replace_char,
+            keep_tabs=options.keep_tabs,
+            keep_newlines=options.keep_newlines,
+            ascii_only=options.ascii_only,
+            raw=options.raw,
+            counts=counts,
+            filter_counts=filter_counts,
+            notags_sink=notags_sink,
+        )
+    if not options.keep_footer:
+        cleaned = strip_footer(cleaned)
+    return cleaned, counts, filter_counts, notags[0] if notags else None
+
+
+def _write_pages(
+    matches: list[FocusMatch],
+    rendered: Iterator[tuple[str, SanitizeCounts, FilterCounts, str | None]],
+    *,
+    output_dir: Path,
+    output_formats: tuple[str, ...],
+    output_encoding: str,
+    output_errors: str,
+) -> int:
+    output_exts = {fmt: ".md" if fmt == "markdown" else ".txt" for fmt in output_formats}
+    for match in matches:
+        if match.row is None:
+            warn(f"Missing page: {match.entry.name}")
+            continue
+        for message in _structure_warnings(match.row.content):
+            warn(f"{message} in page '{match.entry.name}'")
+        combined_counts = None
+        combined_filter_counts = None
+        for fmt in output_formats:
+            cleaned, counts, filter_counts, notags_text = next(rendered)
+            if notags_text is not None:
+                notags_path = output_dir / safe_filename(match.entry.name, "_notags.txt")
+                try:
+                    write_text_check(
+                        notags_path,
+                        notags_text,
+                        encoding=output_encoding,
+                        errors=output_errors,
+                        label="dump notags",
+                    )
+                except OSError as exc:
+                    error(str(exc))
+                    return 1
+            out_path = output_dir / safe_filename(match.entry.name, output_exts[fmt])
+            try:
+                write_text_check(
+                    out_path,
+                    cleaned,
+                    encoding=output_encoding,
+                    errors=output_errors,
+                    label="output",
+                )
+            except OSError as exc:
+                error(str(exc))
+                return 1
+            print(f"Wrote {out_path} ({match.row.id}, {match.label})")
+            if combined_counts is None:
+                combined_counts = counts
+                combined_filter_counts = filter_counts
+            else:
+                for field in combined_counts.__dataclass_fields__:
+                    setattr(
+                        combined_counts,
+                        field,
+                        max(
+                            getattr(combined_counts, field),
+                            getattr(counts, field),
+                        ),
+                    )
+                for field in combined_filter_counts.__dataclass_fields__:
+                    setattr(
+                        combined_filter_counts,
+                        field,
+                        max(
+                            getattr(combined_filter_counts, field),
+                            getattr(filter_counts, field),
+                        ),
+                    )
+
+        counts = combined_counts if combined_counts is not None else SanitizeCounts()
+        filter_counts = (
+            combined_filter_counts
+            if combined_filter_counts is not None
+            else FilterCounts()
+        )
+        page_name = match.entry.name
+        messages: list[str] = []
+        if counts.other_scheme_links:
+            warn(
+                f"Non-HTTP scheme links: {counts.other_scheme_links} in page '{page_name}'",
+                messages=messages,
+            )
+        if counts.other_scheme_images:
+            warn(
+                f"Non-HTTP scheme images: {counts.other_scheme_images} in page '{page_name}'",
+                messages=messages,
+            )
+        if counts.missing_scheme_links:
+            warn(
+                f"Missing scheme links: {counts.missing_scheme_links} in page '{page_name}'",
+                messages=messages,
+            )
+        if counts.missing_scheme_images:
+            warn(
+                f"Missing scheme images: {counts.missing_scheme_images} in page '{page_name}'",
+                messages=messages,
+            )
+        page_counts = (
+            ("Blocks removed", counts.blocks_rm),
+            ("Comments removed", counts.comments_rm),
+            ("Tags removed", counts.tags_rm),
+            ("Entities removed", counts.entities_rm),
+            ("Anchors converted", counts.anchors_conv),
+            ("Images converted", counts.images_conv),
+            ("Headings converted", counts.headings_conv),
+            ("List items converted", counts.lists_conv),
+            ("Table cells converted", counts.tables_conv),
+            ("Blocks converted", counts.blocks_conv),
+            ("Blocked scheme links", counts.blocked_scheme_links),
+            ("Blocked scheme images", counts.blocked_scheme_images),
+            ("Missing scheme links", counts.missing_scheme_links),
+            ("Missing scheme images", counts.missing_scheme_images),
+            ("Control chars removed", filter_counts.re_control),
+            ("Zero-width removed", filter_counts.re_zero),
+            ("Tabs removed", filter_counts.re_tab),
+            ("Newlines removed", filter_counts.re_nl),
+            ("Non-ASCII removed", filter_counts.re_non_ascii),
+            ("Replacement chars", filter_counts.rep_chars),
+        )
+        for label, count in page_counts:
+            if count:
+                info_page_count(label, count, page_name, messages=messages)
+        flush_messages(messages)
+
+    return 0
 
 
 def main() -> int:
@@ -716,13 +1034,13 @@ def main() -> int:
     )
     add_dump_args(parser, include_notags=True)
     add_filter_args(parser)
+    add_jobs_args(parser)
     args = parser.parse_args()
 
     if not validate_limits(args.lines, args.max_bytes):
         return 1
-    if args.permit:
-        args.strict_header = False
-        args.strict_columns = False
+    if not validate_jobs(args.jobs):
+        return 1
 
     filter_args = resolve_filter_args(args, keep_tabs_default=True)
     if filter_args is None:
@@ -743,28 +1061,12 @@ def main() -> int:
     focus_entries = load_focus_entries(pages_path, case_sensitive)
     if focus_entries is None:
         return 1
-    strict_header = args.strict_header
-    strict_columns = args.strict_columns
-    input_path = Path(args.input)
-    dump_rows_dir = Path(args.dump_rows) if args.dump_rows else None
-    result = parse_dump_check(
-        input_path,
-        max_lines=args.lines,
-        max_bytes=args.max_bytes,
-        use_csv=args.csvin,
-        include_content=True,
-        strict_header=strict_header,
-        strict_columns=strict_columns,
-        dump_rows_dir=dump_rows_dir,
+    keep_content = content_filter(
+        focus_entries, case_sensitive=case_sensitive, use_prefix=use_prefix
     )
+    result = load_dump(args, include_content=True, keep_content=keep_content)
     if result is None:
         return 1
-    emit_db_warnings(
-        result,
-        input_path,
-        strict_header=strict_header,
-        strict_columns=strict_columns,
-    )
     if not focus_entries:
         error("pages list must include at least one page name.")
         return 1
@@ -776,162 +1078,34 @@ def main() -> int:
         error(str(exc))
         return 1
 
-    rows = result.rows
-    for match in match_entries(
-        focus_entries, rows, case_sensitive=case_sensitive, use_prefix=use_prefix
-    ):
-        if match.row is None:
-            warn(f"Missing page: {match.entry.name}")
-            continue
-        for message in _structure_warnings(match.row.content):
-            warn(f"{message} in page '{match.entry.name}'")
-        notags_path = (
-            output_dir / safe_filename(match.entry.name, "_notags.txt")
-            if args.notags
-            else None
-        )
-        combined_counts = None
-        combined_filter_counts = None
-        wrote_notags = False
-        for fmt in output_formats:
-            counts = SanitizeCounts()
-            filter_counts = FilterCounts()
-            notags_sink = None
-            if notags_path is not None and not wrote_notags:
-                notags_sink = make_dump_notags_sink(
-                    notags_path,
-                    encoding=output_encoding,
-                    errors=output_errors,
-                )
-                wrote_notags = True
-            try:
-                if fmt == "markdown":
-                    cleaned = clean_md(
-                        match.row.content,
-                        replace_char=replace_char,
-                        keep_tabs=keep_tabs,
-                        keep_newlines=keep_newlines,
-                        ascii_only=ascii_only,
-                        raw=raw,
-                        counts=counts,
-                        filter_counts=filter_counts,
-                        notags_sink=notags_sink,
-                    )
-                    output_ext = ".md"
-                else:
-                    cleaned = clean_content(
-                        match.row.content,
-                        table_delim=table_delim,
-                        replace_char=replace_char,
-                        keep_tabs=keep_tabs,
-                        keep_newlines=keep_newlines,
-                        ascii_only=ascii_only,
-                        raw=raw,
-                        counts=counts,
-                        filter_counts=filter_counts,
-                        notags_sink=notags_sink,
-                    )
-                    output_ext = ".txt"
-            except OSError as exc:
-                error(str(exc))
-                return 1
-            if not args.footer:
-                cleaned = strip_footer(cleaned)
-            out_path = output_dir / safe_filename(match.entry.name, output_ext)
-            try:
-                write_text_check(
-                    out_path,
-                    cleaned,
-                    encoding=output_encoding,
-                    errors=output_errors,
-                    label="output",
-                )
-            except OSError as exc:
-                error(str(exc))
-                return 1
-            print(f"Wrote {out_path} ({match.row.id}, {match.label})")
-            if combined_counts is None:
-                combined_counts = counts
-                combined_filter_counts = filter_counts
-            else:
-                for field in combined_counts.__dataclass_fields__:
-                    setattr(
-                        combined_counts,
-                        field,
-                        max(
-                            getattr(combined_counts, field),
-                            getattr(counts, field),
-                        ),
-                    )
-                for field in combined_filter_counts.__dataclass_fields__:
-                    setattr(
-                        combined_filter_counts,
-                        field,
-                        max(
-                            getattr(combined_filter_counts, field),
-                            getattr(filter_counts, field),
-                        ),
-                    )
-
-        counts = combined_counts if combined_counts is not None else SanitizeCounts()
-        filter_counts = (
-            combined_filter_counts
-            if combined_filter_counts is not None
-            else FilterCounts()
-        )
-        if counts.other_scheme_links:
-            warn(
-                f"Non-HTTP scheme links: {counts.other_scheme_links} in page '{match.entry.name}'"
-            )
-        if counts.other_scheme_images:
-            warn(
-                f"Non-HTTP scheme images: {counts.other_scheme_images} in page '{match.entry.name}'"
-            )
-        if counts.missing_scheme_links:
-            warn(
-                f"Missing scheme links: {counts.missing_scheme_links} in page '{match.entry.name}'"
-            )
-        if counts.missing_scheme_images:
-            warn(
-                f"Missing scheme images: {counts.missing_scheme_images} in page '{match.entry.name}'"
-            )
-        info_page_count("Blocks removed", counts.blocks_rm, match.entry.name)
-        info_page_count("Comments removed", counts.comments_rm, match.entry.name)
-        info_page_count("Tags removed", counts.tags_rm, match.entry.name)
-        info_page_count("Entities removed", counts.entities_rm, match.entry.name)
-        info_page_count("Anchors converted", counts.anchors_conv, match.entry.name)
-        info_page_count("Images converted", counts.images_conv, match.entry.name)
-        info_page_count("Headings converted", counts.headings_conv, match.entry.name)
-        info_page_count("List items converted", counts.lists_conv, match.entry.name)
-        info_page_count("Table cells converted", counts.tables_conv, match.entry.name)
-        info_page_count("Blocks converted", counts.blocks_conv, match.entry.name)
-        info_page_count(
-            "Blocked scheme links", counts.blocked_scheme_links, match.entry.name
-        )
-        info_page_count(
-            "Blocked scheme images", counts.blocked_scheme_images, match.entry.name
-        )
-        info_page_count(
-            "Missing scheme links", counts.missing_scheme_links, match.entry.name
-        )
-        info_page_count(
-            "Missing scheme images", counts.missing_scheme_images, match.entry.name
-        )
-        info_page_count(
-            "Control chars removed", filter_counts.re_control, match.entry.name
-        )
-        info_page_count("Zero-width removed", filter_counts.re_zero, match.entry.name)
-        info_page_count("Tabs removed", filter_counts.re_tab, match.entry.name)
-        info_page_count("Newlines removed", filter_counts.re_nl, match.entry.name)
-        info_page_count(
-            "Non-ASCII removed", filter_counts.re_non_ascii, match.entry.name
-        )
-        info_page_count(
-            "Replacement chars", filter_counts.rep_chars, match.entry.name
+    options = RenderOptions(
+        table_delim=table_delim,
+        replace_char=replace_char,
+        keep_tabs=keep_tabs,
+        keep_newlines=keep_newlines,
+        ascii_only=ascii_only,
+        raw=raw,
+        keep_footer=args.footer,
+    )
+    matches = match_entries(
+        focus_entries, result.rows, case_sensitive=case_sensitive, use_prefix=use_prefix
+    )
+    tasks = [
+        (match.row.content, fmt, args.notags and index == 0, options)
+        for match in matches
+        if match.row is not None
+        for index, fmt in enumerate(output_formats)
+    ]
+    with map_jobs(_render_page, tasks, args.jobs) as rendered:
+        return _write_pages(
+            matches,
+            rendered,
+            output_dir=output_dir,
+            output_formats=output_formats,
+            output_encoding=output_encoding,
+            output_errors=output_errors,
         )
 
-    return 0
-
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -24,14 +25,27 @@ KNOWN_STATUSES = (
     "auto-draft",
     "trash",
 )
+STATUS_RANK = {status: rank for rank, status in enumerate(KNOWN_STATUSES)}
 DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d")
+MIN_READ_BUFFER = 64 * 1024
+MAX_READ_BUFFER = 1024 * 1024
+
+
+class _MysqlTabDialect(csv.Dialect):
+    delimiter = "\t"
+    quotechar = None
+    escapechar = "\\"
+    doublequote = False
+    skipinitialspace = False
+    lineterminator = "\n"
+    quoting = csv.QUOTE_NONE
 
 
 class ParseError(ValueError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Row:
     id: str
     title: str
@@ -60,6 +74,20 @@ class ParseStats:
     unknown_status_count: int = 0
     invalid_date_count: int = 0
 
+    def is_clean(self) -> bool:
+        return not any(
+            (
+                self.skipped_oversized,
+                self.skipped_malformed,
+                self.invalid_id_count,
+                self.duplicate_id_count,
+                self.unknown_status_count,
+                self.invalid_date_count,
+                self.header_mismatch,
+                self.reached_limit,
+            )
+        )
+
 
 @dataclass(frozen=True)
 class ParseResult:
@@ -68,13 +96,14 @@ class ParseResult:
 
 
 def parse_dump(
-    path: Path,
+    path: str | Path,
     *,
     limits: ParseLimits | None = None,
     strict_header: bool = True,
     strict_columns: bool = True,
     use_csv: bool = False,
     include_content: bool = True,
+    keep_content: Callable[[str], bool] | None = None,
     dump_rows_dir: Path | None = None,
 ) -> ParseResult:
     if limits is None:
@@ -83,6 +112,8 @@ def parse_dump(
     stats = ParseStats()
     rows: list[Row] = []
     seen_ids: set[str] = set()
+    # Statuses and dates repeat across rows; keep one string object per value.
+    shared: dict[str, str] = {}
     dump_index = 0
     try:
         handle = open_text_check(
@@ -92,6 +123,7 @@ def parse_dump(
             errors="replace",
             newline="\n",
             label="input",
+            buffering=read_buffer_size(limits.max_bytes),
         )
     except FileNotFoundError:
         raise
@@ -124,19 +156,13 @@ def parse_dump(
                 break
             stats.read_lines += 1
             if limits.max_bytes:
-                line_size = len(line.encode("utf-8"))
+                line_size = _utf8_size(line)
                 if line_size > limits.max_bytes:
                     stats.skipped_oversized += 1
                     continue
 
             if use_csv:
-                reader = csv.reader(
-                    [line],
-                    delimiter="\t",
-                    quoting=csv.QUOTE_NONE,
-                    escapechar="\\",
-                )
-                parts = next(reader)
+                parts = next(csv.reader((line,), _MysqlTabDialect))
             else:
                 parts = line.split("\t", 4)
 
@@ -150,16 +176,18 @@ def parse_dump(
                 continue
 
             post_id, title, content, status, post_date = parts
-            content_bytes = len(content.encode("utf-8"))
-            _validate_id(post_id, stats)
+            status = shared.setdefault(status, status)
+            post_date = shared.setdefault(post_date, post_date)
+            content_bytes = _utf8_size(content)
+            _validate_row(post_id, status, post_date, stats)
             if post_id:
                 if post_id in seen_ids:
                     stats.duplicate_id_count += 1
                 else:
                     seen_ids.add(post_id)
-            _validate_status(status, stats)
-            _validate_date(post_date, stats)
-            if not include_content:
+            if not include_content or (
+                keep_content is not None and not keep_content(title)
+            ):
                 content = ""
             rows.append(
                 Row(
@@ -174,9 +202,15 @@ def parse_dump(
     return ParseResult(rows=rows, stats=stats)
 
 
+def read_buffer_size(max_bytes: int) -> int:
+    if not max_bytes:
+        return MAX_READ_BUFFER
+    return min(max(MIN_READ_BUFFER, max_bytes), MAX_READ_BUFFER)
+
+
 def dump_rows(out_dir: Path, row_index: int, parts: list[str]) -> Path:
     out_path = out_dir / f"{row_index}.txt"
-    if out_path.exists() and out_path.is_dir():
+    if out_path.is_dir():
         raise ParseError(f"Dump rows path is a directory: {out_path}")
     try:
         write_text_check(
@@ -199,35 +233,64 @@ def prepare_dump_rows_dir(out_dir: Path) -> None:
         raise ParseError(format_dir_create_error("Dump rows", out_dir, exc))
 
 
-def format_header_error(path: Path, actual: list[str], expected: list[str]) -> str:
+def format_header_error(path: str | Path, actual: list[str], expected: list[str]) -> str:
     return f"Header error in {path}: {actual!r} (expected {expected!r})"
 
 
-def format_row_error(path: Path, line_no: int, expected: int, got: int) -> str:
+def format_row_error(path: str | Path, line_no: int, expected: int, got: int) -> str:
     return (
         f"Malformed row at line {line_no} in {path}: expected {expected} columns, "
         f"got {got}"
     )
 
 
-def _validate_id(value: str, stats: ParseStats) -> None:
-    if not value.isdigit() or int(value) <= 0:
-        stats.invalid_id_count += 1
-
-
-def _validate_status(value: str, stats: ParseStats) -> None:
-    if value.lower() not in KNOWN_STATUSES:
-        stats.unknown_status_count += 1
+def _utf8_size(text: str) -> int:
+    # str.isascii() reads a flag on the string, so ASCII text skips the encode.
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _canonical_date_ok(value: str) -> bool | None:
+    # Zero-padded "YYYY-MM-DD[ HH:MM:SS]" is checked by building the datetime;
+    # None defers any other shape to strptime.
+    if len(value) not in (10, 19) or not value.isascii():
+        return None
+    if value[4] != "-" or value[7] != "-":
+        return None
+    fields = [value[0:4], value[5:7], value[8:10]]
+    if len(value) == 19:
+        if value[10] != " " or value[13] != ":" or value[16] != ":":
+            return None
+        fields += [value[11:13], value[14:16], value[17:19]]
+    if not all(part.isdigit() for part in fields):
+        return None
+    try:
+        datetime(*map(int, fields))
+    except ValueError:
+        return False
+    return True
 
 
-def _validate_date(value: str, stats: ParseStats) -> None:
+def _date_ok(value: str) -> bool:
+    valid = _canonical_date_ok(value)
+    if valid is not None:
+        return valid
     for fmt in DATE_FORMATS:
         try:
             datetime.strptime(value, fmt)
-            return
+            return True
         except ValueError:
             continue
-    stats.invalid_date_count += 1
+    return False
+
+
+def _validate_row(post_id: str, status: str, post_date: str, stats: ParseStats) -> None:
+    # One call per row for the id, status and date checks.
+    if not post_id.isdigit() or int(post_id) <= 0:
+        stats.invalid_id_count += 1
+    if status.lower() not in STATUS_RANK:
+        stats.unknown_status_count += 1
+    if not _date_ok(post_date):
+        stats.invalid_date_count += 1
 
 
 def build_title_index(rows: list[Row], *, case_sensitive: bool = True) -> dict[str, list[Row]]:
@@ -246,23 +309,19 @@ def build_id_index(rows: list[Row]) -> dict[str, list[Row]]:
 
 
 def status_rank(status: str) -> int:
-    status_key = status.lower()
-    if status_key in KNOWN_STATUSES:
-        return KNOWN_STATUSES.index(status_key)
-    return len(KNOWN_STATUSES)
+    return STATUS_RANK.get(status.lower(), len(KNOWN_STATUSES))
 
 
 def pick_best(matches: list[Row]) -> Row | None:
     best = None
+    best_rank = 0
     for row in matches:
-        if best is None:
-            best = row
-            continue
         row_rank = status_rank(row.status)
-        best_rank = status_rank(best.status)
-        if row_rank < best_rank:
-            best = row
-            continue
-        if row_rank == best_rank and row.date > best.date:
+        if (
+            best is None
+            or row_rank < best_rank
+            or (row_rank == best_rank and row.date > best.date)
+        ):
             best = row
+            best_rank = row_rank
     return best
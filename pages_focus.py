@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple, TypeAlias
@@ -17,6 +19,13 @@ class RowKey(NamedTuple):
 RowsWithKeys: TypeAlias = list[RowKey]
 # RowsWithKeys pairs a normalized title key with its Row for prefix matching.
 
+
+# PrefixIndex holds the RowsWithKeys keys in sorted order with their list positions.
+class PrefixIndex(NamedTuple):
+    keys: list[str]
+    positions: list[int]
+
+
 @dataclass(frozen=True)
 class FocusEntry:
     name: str
@@ -24,6 +33,12 @@ class FocusEntry:
     key_len: int
 
 
+# FocusIndex maps focus keys to their first entry, with key lengths longest first.
+class FocusIndex(NamedTuple):
+    by_key: dict[str, FocusEntry]
+    lengths: list[int]
+
+
 @dataclass(frozen=True)
 class FocusListResult:
     entries: list[FocusEntry]
@@ -37,7 +52,7 @@ class FocusMatch:
     row: Row | None
 
 
-def load_focus_list(path: Path, case_sensitive: bool) -> FocusListResult:
+def load_focus_list(path: str | Path, case_sensitive: bool) -> FocusListResult:
     text = read_text_check(path, encoding="utf-8", errors="replace", label="pages list")
     parts = text.replace(",", "\n").splitlines()
     focus_entries: list[FocusEntry] = []
@@ -58,27 +73,63 @@ def load_focus_list(path: Path, case_sensitive: bool) -> FocusListResult:
 
 
 
+def content_filter(
+    entries: list[FocusEntry], *, case_sensitive: bool, use_prefix: bool
+) -> Callable[[str], bool]:
+    # Only rows whose title can match an entry need their content kept.
+    keys = tuple(entry.key for entry in entries)
+    key_set = frozenset(keys)
+
+    def keep(title: str) -> bool:
+        key = title if case_sensitive else title.lower()
+        return key in key_set or (use_prefix and key.startswith(keys))
+
+    return keep
+
+
 def build_rows_keys(rows: list[Row], case_sensitive: bool) -> RowsWithKeys:
     return [
         RowKey(row.title if case_sensitive else row.title.lower(), row) for row in rows
     ]
 
 
+def build_prefix_index(rows_with_keys: RowsWithKeys) -> PrefixIndex:
+    # The sort is stable, so equal keys keep their row order.
+    positions = sorted(range(len(rows_with_keys)), key=lambda i: rows_with_keys[i].key)
+    return PrefixIndex([rows_with_keys[i].key for i in positions], positions)
+
+
+def prefix_rows(
+    prefix: str, rows_with_keys: RowsWithKeys, prefix_index: PrefixIndex
+) -> list[Row]:
+    # Keys starting with the prefix sort into one run beginning at bisect_left.
+    keys = prefix_index.keys
+    start = end = bisect_left(keys, prefix)
+    while end < len(keys) and keys[end].startswith(prefix):
+        end += 1
+    positions = sorted(prefix_index.positions[start:end])
+    return [rows_with_keys[i].row for i in positions]
+
+
 def match_focus_entry(
     entry: FocusEntry,
     *,
     title_index: dict[str, list[Row]],
     rows_with_keys: RowsWithKeys,
     use_prefix: bool,
+    prefix_index: PrefixIndex | None = None,
 ) -> tuple[str, Row | None]:
     exact_matches = title_index.get(entry.key, [])
     if exact_matches:
         best = exact_matches[0] if len(exact_matches) == 1 else pick_best(exact_matches)
         return ("exact", best)
     if use_prefix:
-        prefix_matches = [
-            item.row for item in rows_with_keys if item.key.startswith(entry.key)
-        ]
+        if prefix_index is not None:
+            prefix_matches = prefix_rows(entry.key, rows_with_keys, prefix_index)
+        else:
+            prefix_matches = [
+                item.row for item in rows_with_keys if item.key.startswith(entry.key)
+            ]
         if prefix_matches:
             best = (
                 prefix_matches[0]
@@ -89,12 +140,37 @@ def match_focus_entry(
     return ("none", None)
 
 
+def build_focus_index(focus_entries: list[FocusEntry]) -> FocusIndex:
+    by_key: dict[str, FocusEntry] = {}
+    for entry in focus_entries:
+        by_key.setdefault(entry.key, entry)
+    lengths = sorted({len(key) for key in by_key}, reverse=True)
+    return FocusIndex(by_key, lengths)
+
+
 def match_label(
-    row: Row, focus_entries: list[FocusEntry], case_sensitive: bool, use_prefix: bool
+    row: Row,
+    focus_entries: list[FocusEntry],
+    case_sensitive: bool,
+    use_prefix: bool,
+    *,
+    focus_index: FocusIndex | None = None,
 ) -> tuple[str, str]:
     if not focus_entries:
         return ("none", "")
     title_key = row.title if case_sensitive else row.title.lower()
+    if focus_index is not None:
+        # The longest matching prefix is found by probing each key length once.
+        by_key = focus_index.by_key
+        entry = by_key.get(title_key)
+        if entry is not None:
+            return ("exact", entry.name)
+        if use_prefix:
+            for length in focus_index.lengths:
+                entry = by_key.get(title_key[:length])
+                if entry is not None:
+                    return ("prefix", entry.name)
+        return ("none", "")
     for entry in focus_entries:
         if title_key == entry.key:
             return ("exact", entry.name)
@@ -118,6 +194,7 @@ def match_entries(
 ) -> list[FocusMatch]:
     title_index = build_title_index(rows, case_sensitive=case_sensitive)
     rows_with_keys = build_rows_keys(rows, case_sensitive) if use_prefix else []
+    prefix_index = build_prefix_index(rows_with_keys) if use_prefix else None
     matches: list[FocusMatch] = []
     for entry in entries:
         label, row = match_focus_entry(
@@ -125,6 +202,7 @@ def match_entries(
             title_index=title_index,
             rows_with_keys=rows_with_keys,
             use_prefix=use_prefix,
+            prefix_index=prefix_index,
         )
         matches.append(FocusMatch(entry=entry, label=label, row=row))
     return matches
@@ -8,37 +8,31 @@ from pathlib import Path
 from pages_cli import (
     add_common_args,
     add_dump_args,
-    emit_db_warnings,
     error,
+    load_dump,
     load_focus_entries,
-    parse_dump_check,
     warn,
     validate_limits,
 )
-from pages_focus import match_entries, match_label
+from pages_focus import build_focus_index, match_entries, match_label
 from pages_util import prepare_output_dir, write_text_check
 
 
-def emit_row(focus: str, row, match: str) -> dict:
+def emit_row(focus: str, row, match: str, *, details: bool) -> list:
+    # Records are built in CSV column order so they can be written as is.
     if row is None:
-        return {
-            "focus": focus,
-            "title": "",
-            "id": "",
-            "status": "",
-            "date": "",
-            "match": match or "none",
-            "content_bytes": "",
-        }
-    return {
-        "focus": focus or "",
-        "title": row.title,
-        "id": row.id,
-        "status": row.status,
-        "date": row.date,
-        "match": match or "",
-        "content_bytes": row.content_bytes,
-    }
+        return ["", "", "", "", match or "none", focus, ""]
+    if details:
+        return [
+            row.title,
+            row.id,
+            row.status,
+            row.date,
+            match or "",
+            focus or "",
+            row.content_bytes,
+        ]
+    return [row.title, row.id, row.status, row.date, row.content_bytes]
 
 
 def main() -> int:
@@ -70,9 +64,6 @@ def main() -> int:
     if args.only and args.details:
         error("--only cannot be used with --details.")
         return 1
-    if args.permit:
-        args.strict_header = False
-        args.strict_columns = False
 
     use_prefix = args.use_prefix if args.use_prefix is not None else args.details
     case_sensitive = (
@@ -83,28 +74,9 @@ def main() -> int:
     focus_entries = load_focus_entries(pages_path, case_sensitive)
     if focus_entries is None:
         return 1
-    strict_header = args.strict_header
-    strict_columns = args.strict_columns
-    input_path = Path(args.input)
-    dump_rows_dir = Path(args.dump_rows) if args.dump_rows else None
-    result = parse_dump_check(
-        input_path,
-        max_lines=args.lines,
-        max_bytes=args.max_bytes,
-        use_csv=args.csvin,
-        include_content=False,
-        strict_header=strict_header,
-        strict_columns=strict_columns,
-        dump_rows_dir=dump_rows_dir,
-    )
+    result = load_dump(args, include_content=False)
     if result is None:
         return 1
-    emit_db_warnings(
-        result,
-        input_path,
-        strict_header=strict_header,
-        strict_columns=strict_columns,
-    )
     if args.only and not focus_entries:
         error("pages list must include at least one page name.")
         return 1
@@ -123,49 +95,38 @@ def main() -> int:
         list_path = output_dir / "pages.list"
 
     output = []
+    used_ids: set[str] = set()
     rows = result.rows
     if focus_entries:
         for match in match_entries(
             focus_entries, rows, case_sensitive=case_sensitive, use_prefix=use_prefix
         ):
             if match.row is not None:
-                output.append(emit_row(match.entry.name, match.row, match.label))
+                output.append(
+                    emit_row(match.entry.name, match.row, match.label, details=args.details)
+                )
+                if match.row.id:
+                    used_ids.add(match.row.id)
                 continue
             warn(f"Missing page: {match.entry.name}")
             if args.details:
-                output.append(emit_row(match.entry.name, None, "none"))
+                output.append(emit_row(match.entry.name, None, "none", details=True))
 
     if not args.only:
-        used_ids = {row["id"] for row in output if row["id"]}
+        focus_index = build_focus_index(focus_entries)
         for row in rows:
             if row.id in used_ids:
                 continue
             if args.details:
-                label, focus = match_label(row, focus_entries, case_sensitive, use_prefix)
-                output.append(emit_row(focus, row, label))
+                label, focus = match_label(
+                    row, focus_entries, case_sensitive, use_prefix, focus_index=focus_index
+                )
+                output.append(emit_row(focus, row, label, details=True))
             else:
-                output.append(emit_row("", row, ""))
+                output.append(emit_row("", row, "", details=False))
 
     buffer = io.StringIO()
-    writer = csv.writer(buffer, lineterminator="\n")
-    if args.details:
-        for row in output:
-            writer.writerow(
-                [
-                    row["title"],
-                    row["id"],
-                    row["status"],
-                    row["date"],
-                    row["match"],
-                    row["focus"],
-                    row["content_bytes"],
-                ]
-            )
-    else:
-        for row in output:
-            writer.writerow(
-                [row["title"], row["id"], row["status"], row["date"], row["content_bytes"]]
-            )
+    csv.writer(buffer, lineterminator="\n").writerows(output)
 
     output_text = buffer.getvalue()
     if output_dir_value is None:
@@ -177,7 +138,7 @@ def main() -> int:
             error(str(exc))
             return 1
     if list_path is not None:
-        list_text = "\n".join(row["title"] for row in output if row["title"]) + "\n"
+        list_text = "\n".join(record[0] for record in output if record[0]) + "\n"
         try:
             write_text_check(list_path, list_text, encoding="utf-8", label="output")
         except OSError as exc:
@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 import argparse
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import NamedTuple
 
 from pages_cli import (
     add_common_args,
     add_dump_args,
     add_filter_args,
-    emit_db_warnings,
+    add_jobs_args,
     error,
+    flush_messages,
     info_page_count,
+    load_dump,
     load_focus_entries,
-    parse_dump_check,
+    map_jobs,
     resolve_filter_args,
+    validate_jobs,
     validate_limits,
     warn,
 )
@@ -22,13 +26,18 @@ from pages_util import (
     SanitizeCounts,
     decode_mysql_escapes,
     filter_characters,
-    make_dump_notags_sink,
     prepare_output_dir,
     write_text_check,
     safe_filename,
     strip_footer,
 )
-from pages_focus import match_entries
+from pages_focus import FocusMatch, content_filter, match_entries
+
+SCRIPT_STYLE_RE = re.compile(r"(?is)<(script|style)[^>]*>.*?</\1>")
+COMMENT_RE = re.compile(r"(?s)<!--.*?-->")
+ALL_TAGS_RE = re.compile(r"(?s)<[^>]+>")
+ENTITY_RE = re.compile(r"&[A-Za-z0-9#]+;")
+WS_RUN_RE = re.compile(r"[ \t]+")
 
 
 def clean_text(
@@ -49,25 +58,26 @@ def clean_text(
     text = decode_mysql_escapes(text)
 
     # Remove scripts, styles, and comments to avoid inline code.
-    text, blocks_rm = re.subn(r"(?is)<(script|style)[^>]*>.*?</\1>", " ", text)
+    text, blocks_rm = SCRIPT_STYLE_RE.subn(" ", text)
     if counts is not None:
         counts.blocks_rm += blocks_rm
-    text, comments_rm = re.subn(r"(?s)<!--.*?-->", " ", text)
+    text, comments_rm = COMMENT_RE.subn(" ", text)
     if counts is not None:
         counts.comments_rm += comments_rm
 
     # Strip all remaining tags.
-    text, tags_rm = re.subn(r"(?s)<[^>]+>", " ", text)
+    text, tags_rm = ALL_TAGS_RE.subn(" ", text)
     if counts is not None:
         counts.tags_rm += tags_rm
     if notags_sink is not None:
         notags_sink(text)
 
     # Strip HTML entities and normalize whitespace.
-    text, entities_rm = re.subn(r"&[A-Za-z0-9#]+;", " ", text)
+    text, entities_rm = ENTITY_RE.subn(" ", text)
     if counts is not None:
         counts.entities_rm += entities_rm
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     if not raw:
         text = filter_characters(
             text,
@@ -77,7 +87,7 @@ def clean_text(
             ascii_only=ascii_only,
             counts=filter_counts,
         )
-    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.split("\n")]
+    lines = [WS_RUN_RE.sub(" ", line).strip() for line in text.split("\n")]
 
     out_lines = []
     blank = False
@@ -96,6 +106,100 @@ def clean_text(
     return cleaned
 
 
+class RenderOptions(NamedTuple):
+    replace_char: str
+    keep_tabs: bool
+    keep_newlines: bool
+    ascii_only: bool
+    raw: bool
+    keep_footer: bool
+
+
+def _render_page(
+    task: tuple[str, bool, RenderOptions],
+) -> tuple[str, SanitizeCounts, FilterCounts, str | None]:
+    # Module-level and fed plain values so --jobs workers can pickle the task.
+    content, want_notags, options = task
+    counts = SanitizeCounts()
+    filter_counts = FilterCounts()
+    notags: list[str] = []
+    cleaned = clean_text(
+        content,
+        replace_char=options.replace_char,
+        keep_newlines=options.keep_newlines,
+        ascii_only=options.ascii_only,
+        raw=options.raw,
+        keep_tabs=options.keep_tabs,
+        counts=counts,
+        filter_counts=filter_counts,
+        notags_sink=notags.append if want_notags else None,
+    )
+    if not options.keep_footer:
+        cleaned = strip_footer(cleaned)
+    return cleaned, counts, filter_counts, notags[0] if notags else None
+
+
+def _write_pages(
+    matches: list[FocusMatch],
+    rendered: Iterator[tuple[str, SanitizeCounts, FilterCounts, str | None]],
+    *,
+    output_dir: Path,
+    output_encoding: str,
+    output_errors: str,
+) -> int:
+    for match in matches:
+        if match.row is None:
+            warn(f"Missing page: {match.entry.name}")
+            continue
+        cleaned, sanitize_counts, filter_counts, notags_text = next(rendered)
+        if notags_text is not None:
+            notags_path = output_dir / safe_filename(match.entry.name, "_notags.txt")
+            try:
+                write_text_check(
+                    notags_path,
+                    notags_text,
+                    encoding=output_encoding,
+                    errors=output_errors,
+                    label="dump notags",
+                )
+            except OSError as exc:
+                error(str(exc))
+                return 1
+        out_path = output_dir / safe_filename(match.entry.name, ".text")
+        try:
+            write_text_check(
+                out_path,
+                cleaned,
+                encoding=output_encoding,
+                errors=output_errors,
+                label="output",
+            )
+        except OSError as exc:
+            error(str(exc))
+            return 1
+        print(f"Wrote {out_path} ({match.row.id}, {match.label})")
+        page_name = match.entry.name
+        page_counts = (
+            ("Blocks removed", sanitize_counts.blocks_rm),
+            ("Comments removed", sanitize_counts.comments_rm),
+            ("Tags removed", sanitize_counts.tags_rm),
+            ("Entities removed", sanitize_counts.entities_rm),
+            ("Control chars removed", filter_counts.re_control),
+            ("Zero-width removed", filter_counts.re_zero),
+            ("Tabs removed", filter_counts.re_tab),
+            ("Newlines removed", filter_counts.re_nl),
+            ("Non-ASCII removed", filter_counts.re_non_ascii),
+            ("Replacement chars", filter_counts.rep_chars),
+        )
+        messages: list[str] = []
+        for label, count in page_counts:
+            if count:
+                info_page_count(label, count, page_name, messages=messages)
+        flush_messages(messages)
+
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Extract page text from a mysql tab dump and write per-page .text files."
@@ -108,6 +212,7 @@ def main() -> int:
     )
     add_dump_args(parser, include_notags=True)
     add_filter_args(parser)
+    add_jobs_args(parser)
     add_common_args(
         parser,
         prefix_default=False,
@@ -119,9 +224,8 @@ def main() -> int:
 
     if not validate_limits(args.lines, args.max_bytes):
         return 1
-    if args.permit:
-        args.strict_header = False
-        args.strict_columns = False
+    if not validate_jobs(args.jobs):
+        return 1
 
     use_prefix = args.use_prefix if args.use_prefix is not None else False
     case_sensitive = args.case_sensitive if args.case_sensitive is not None else True
@@ -137,28 +241,12 @@ def main() -> int:
     focus_entries = load_focus_entries(pages_path, case_sensitive)
     if focus_entries is None:
         return 1
-    strict_header = args.strict_header
-    strict_columns = args.strict_columns
-    input_path = Path(args.input)
-    dump_rows_dir = Path(args.dump_rows) if args.dump_rows else None
-    result = parse_dump_check(
-        input_path,
-        max_lines=args.lines,
-        max_bytes=args.max_bytes,
-        use_csv=args.csvin,
-        include_content=True,
-        strict_header=strict_header,
-        strict_columns=strict_columns,
-        dump_rows_dir=dump_rows_dir,
+    keep_content = content_filter(
+        focus_entries, case_sensitive=case_sensitive, use_prefix=use_prefix
     )
+    result = load_dump(args, include_content=True, keep_content=keep_content)
     if result is None:
         return 1
-    emit_db_warnings(
-        result,
-        input_path,
-        strict_header=strict_header,
-        strict_columns=strict_columns,
-    )
     if not focus_entries:
         error("pages list must include at least one page name.")
         return 1
@@ -170,81 +258,31 @@ def main() -> int:
         error(str(exc))
         return 1
 
-    rows = result.rows
-    for match in match_entries(
-        focus_entries, rows, case_sensitive=case_sensitive, use_prefix=use_prefix
-    ):
-        if match.row is None:
-            warn(f"Missing page: {match.entry.name}")
-            continue
-        sanitize_counts = SanitizeCounts()
-        filter_counts = FilterCounts()
-        notags_path = (
-            output_dir / safe_filename(match.entry.name, "_notags.txt")
-            if args.notags
-            else None
-        )
-        try:
-            cleaned = clean_text(
-                match.row.content,
-                replace_char=replace_char,
-                keep_newlines=keep_newlines,
-                ascii_only=ascii_only,
-                raw=raw,
-                keep_tabs=keep_tabs,
-                counts=sanitize_counts,
-                filter_counts=filter_counts,
-                notags_sink=(
-                    None
-                    if notags_path is None
-                    else make_dump_notags_sink(
-                        notags_path,
-                        encoding=output_encoding,
-                        errors=output_errors,
-                    )
-                ),
-            )
-        except OSError as exc:
-            error(str(exc))
-            return 1
-        if not args.footer:
-            cleaned = strip_footer(cleaned)
-        out_path = output_dir / safe_filename(match.entry.name, ".text")
-        try:
-            write_text_check(
-                out_path,
-                cleaned,
-                encoding=output_encoding,
-                errors=output_errors,
-                label="output",
-            )
-        except OSError as exc:
-            error(str(exc))
-            return 1
-        print(f"Wrote {out_path} ({match.row.id}, {match.label})")
-        info_page_count("Blocks removed", sanitize_counts.blocks_rm, match.entry.name)
-        info_page_count(
-            "Comments removed", sanitize_counts.comments_rm, match.entry.name
-        )
-        info_page_count("Tags removed", sanitize_counts.tags_rm, match.entry.name)
-        info_page_count(
-            "Entities removed", sanitize_counts.entities_rm, match.entry.name
-        )
-        info_page_count(
-            "Control chars removed", filter_counts.re_control, match.entry.name
-        )
-        info_page_count("Zero-width removed", filter_counts.re_zero, match.entry.name)
-        info_page_count("Tabs removed", filter_counts.re_tab, match.entry.name)
-        info_page_count("Newlines removed", filter_counts.re_nl, match.entry.name)
-        info_page_count(
-            "Non-ASCII removed", filter_counts.re_non_ascii, match.entry.name
-        )
-        info_page_count(
-            "Replacement chars", filter_counts.rep_chars, match.entry.name
+    options = RenderOptions(
+        replace_char=replace_char,
+        keep_tabs=keep_tabs,
+        keep_newlines=keep_newlines,
+        ascii_only=ascii_only,
+        raw=raw,
+        keep_footer=args.footer,
+    )
+    matches = match_entries(
+        focus_entries, result.rows, case_sensitive=case_sensitive, use_prefix=use_prefix
+    )
+    tasks = [
+        (match.row.content, args.notags, options)
+        for match in matches
+        if match.row is not None
+    ]
+    with map_jobs(_render_page, tasks, args.jobs) as rendered:
+        return _write_pages(
+            matches,
+            rendered,
+            output_dir=output_dir,
+            output_encoding=output_encoding,
+            output_errors=output_errors,
         )
 
-    return 0
-
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
+import os
 import re
 import unicodedata
-from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 WINDOWS_RESERVED_NAMES = {"CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"}
 # Windows-invalid filename characters plus ASCII control bytes (0x00-0x1F, 0x7F).
 INVALID_CHARS_RE = re.compile("[<>:\"/\\\\|?*\x00-\x1F\x7F]")
+WS_RE = re.compile(r"\s+")
 ZERO_WIDTH = {"\u200b", "\u200c", "\u200d", "\ufeff"}
 BLOCKED_SCHEMES = {
     "about",
@@ -23,7 +25,7 @@ BLOCKED_SCHEMES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterCounts:
     re_control: int = 0
     re_zero: int = 0
@@ -33,7 +35,7 @@ class FilterCounts:
     rep_chars: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SanitizeCounts:
     blocks_rm: int = 0
     comments_rm: int = 0
@@ -56,6 +58,8 @@ class SanitizeCounts:
 def decode_mysql_escapes(text: str) -> str:
     if not text:
         return ""
+    if "\\" not in text:
+        return text
     return text.replace("\\r", "\n").replace("\\n", "\n").replace("\\t", "\t")
 
 
@@ -76,33 +80,10 @@ def write_text_check(
     errors: str | None = None,
     label: str = "output",
 ) -> None:
-    if path.exists() and path.is_dir():
-        raise OSError(format_path_is_dir(label, path))
-    try:
-        if errors is None:
-            path.write_text(text, encoding=encoding)
-        else:
-            path.write_text(text, encoding=encoding, errors=errors)
-    except OSError as exc:
-        raise OSError(format_file_write_error(label, path, exc))
-
-
-def make_dump_notags_sink(
-    path: Path,
-    *,
-    encoding: str,
-    errors: str | None,
-) -> Callable[[str], None]:
-    def sink(text: str) -> None:
-        write_text_check(
-            path,
-            text,
-            encoding=encoding,
-            errors=errors,
-            label="dump notags",
-        )
-
-    return sink
+    # Encode up front and write bytes; same result as text mode without a codec stream.
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    write_bytes_check(path, text.encode(encoding, errors or "strict"), label=label)
 
 
 def write_bytes_check(
@@ -111,26 +92,29 @@ def write_bytes_check(
     *,
     label: str = "output",
 ) -> None:
-    if path.exists() and path.is_dir():
-        raise OSError(format_path_is_dir(label, path))
     try:
         path.write_bytes(data)
     except OSError as exc:
+        if path.is_dir():
+            raise OSError(format_path_is_dir(label, path))
         raise OSError(format_file_write_error(label, path, exc))
 
 
 def open_text_check(
-    path: Path,
+    path: str | Path,
     *,
     mode: str = "r",
     encoding: str = "utf-8",
     errors: str = "replace",
     newline: str | None = None,
     label: str = "input",
+    buffering: int = -1,
 ):
     try:
-        return path.open(
+        return open(
+            path,
             mode,
+            buffering=buffering,
             encoding=encoding,
             errors=errors,
             newline=newline,
@@ -142,7 +126,7 @@ def open_text_check(
 
 
 def read_text_check(
-    path: Path,
+    path: str | Path,
     *,
     encoding: str = "utf-8",
     errors: str = "replace",
@@ -183,6 +167,19 @@ def format_file_read_error(label: str, path: Path, exc: OSError) -> str:
     return f"{label} file could not be read: {path} ({exc})"
 
 
+@lru_cache(maxsize=8)
+def _filter_run_re(keep_newlines: bool, keep_tabs: bool, ascii_only: bool) -> re.Pattern[str]:
+    # Runs of characters that filter_characters removes or replaces.
+    chars = r"\x00-\x08\x0b-\x1f\x7f" + "".join(sorted(ZERO_WIDTH))
+    if not keep_tabs:
+        chars += r"\t"
+    if not keep_newlines:
+        chars += r"\n"
+    if ascii_only:
+        chars += r"\x80-\U0010ffff"
+    return re.compile(f"[{chars}]+")
+
+
 def filter_characters(
     text: str,
     replace_char: str,
@@ -193,62 +190,39 @@ def filter_characters(
     counts: FilterCounts | None = None,
 ) -> str:
     normalized = unicodedata.normalize("NFKD", text) if ascii_only else text
+    run_re = _filter_run_re(keep_newlines, keep_tabs, ascii_only)
     out: list[str] = []
-    last_replaced = False
-    for ch in normalized:
-        if ch == "\n":
-            if keep_newlines:
-                out.append("\n")
-                last_replaced = False
-            else:
-                if counts is not None:
+    pos = 0
+    # Each run of filtered characters collapses to a single replace_char.
+    for match in run_re.finditer(normalized):
+        out.append(normalized[pos : match.start()])
+        pos = match.end()
+        if counts is not None:
+            for ch in match.group():
+                if ch == "\n":
                     counts.re_nl += 1
-                if replace_char and not last_replaced:
-                    out.append(replace_char)
-                    if counts is not None:
-                        counts.rep_chars += 1
-                    last_replaced = True
-            continue
-        if ch == "\t":
-            if keep_tabs:
-                out.append("\t")
-                last_replaced = False
-            else:
-                if counts is not None:
+                elif ch == "\t":
                     counts.re_tab += 1
-                if replace_char and not last_replaced:
-                    out.append(replace_char)
-                    if counts is not None:
-                        counts.rep_chars += 1
-                    last_replaced = True
-            continue
-        code = ord(ch)
-        is_control = code < 0x20 or code == 0x7F
-        is_zero_width = ch in ZERO_WIDTH
-        is_non_ascii = code >= 0x80
-        if is_control or is_zero_width or (ascii_only and is_non_ascii):
-            if counts is not None:
-                if is_control:
-                    counts.re_control += 1
-                elif is_zero_width:
+                elif ch in ZERO_WIDTH:
                     counts.re_zero += 1
-                elif is_non_ascii:
+                elif ch < "\x20" or ch == "\x7f":
+                    counts.re_control += 1
+                else:
                     counts.re_non_ascii += 1
-            if replace_char and not last_replaced:
-                out.append(replace_char)
-                if counts is not None:
-                    counts.rep_chars += 1
-                last_replaced = True
-            continue
-        out.append(ch)
-        last_replaced = False
+        if replace_char:
+            out.append(replace_char)
+            if counts is not None:
+                counts.rep_chars += 1
+    if not out:
+        return normalized
+    out.append(normalized[pos:])
     return "".join(out)
 
 
 def _normalize_filename_base(name: str) -> str:
     normalized = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
     normalized = INVALID_CHARS_RE.sub("-", normalized)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = WS_RE.sub(" ", normalized).strip()
     normalized = normalized.strip(" .")
     return normalized
 
@@ -305,6 +279,10 @@ def safe_filename(
 def strip_footer(text: str) -> str:
     if not text:
         return text
+    # A footer heading line can only exist where one of the words occurs at all.
+    lowered = text.lower()
+    if "resources" not in lowered and "community" not in lowered:
+        return text
     lines = text.splitlines()
     for idx, line in enumerate(lines):
         if line.strip().lower() in {"resources", "community"}:
@@ -296,6 +296,17 @@ run_text() {
   check_file_exists pages_text_notags "${pages_text_notags_dir}/About_notags.txt"
   check_file_exists pages_text_notags "${pages_text_notags_dir}/Contact_notags.txt"
 
+  pages_text_jobs_dir="${results}/pages_text_jobs"
+  run pages_text_jobs "$PYTHON_BIN" "${ROOT}/pages_text.py" \
+    --input "${TESTS_DIR}/sample.out" \
+    --pages "${TESTS_DIR}/sample.list" \
+    --output-dir "$pages_text_jobs_dir" \
+    --jobs 2
+  check_status pages_text_jobs 0
+  check_file pages_text_jobs "${pages_text_jobs_dir}/Home.text" "${TESTS_DIR}/pages_text_home_expected.txt"
+  check_file pages_text_jobs "${pages_text_jobs_dir}/About.text" "${TESTS_DIR}/pages_text_about_expected.txt"
+  check_file pages_text_jobs "${pages_text_jobs_dir}/Contact.text" "${TESTS_DIR}/pages_text_contact_expected.txt"
+
   pages_text_nested="${results}/pages_text_nested/inner"
   run pages_text_output_dir_nested "$PYTHON_BIN" "${ROOT}/pages_text.py" \
     --input "${TESTS_DIR}/sample.out" \
@@ -376,6 +387,17 @@ run_content() {
   check_file_exists pages_content_notags "${pages_content_notags_dir}/HTML_notags.txt"
   check_file_exists pages_content_notags "${pages_content_notags_dir}/Dirty_notags.txt"
 
+  pages_content_jobs_dir="${results}/pages_content_jobs"
+  run pages_content_jobs "$PYTHON_BIN" "${ROOT}/pages_content.py" \
+    --input "${TESTS_DIR}/sample.out" \
+    --pages "${TESTS_DIR}/sample.list" \
+    --output-dir "$pages_content_jobs_dir" \
+    --jobs 2
+  check_status pages_content_jobs 0
+  check_file pages_content_jobs "${pages_content_jobs_dir}/Home.txt" "${TESTS_DIR}/pages_text_home_expected.txt"
+  check_file pages_content_jobs "${pages_content_jobs_dir}/About.txt" "${TESTS_DIR}/pages_text_about_expected.txt"
+  check_file pages_content_jobs "${pages_content_jobs_dir}/Contact.txt" "${TESTS_DIR}/pages_text_contact_expected.txt"
+
   pages_content_nested="${results}/pages_content_nested/inner"
   run pages_content_output_dir_nested "$PYTHON_BIN" "${ROOT}/pages_content.py" \
     --input "${TESTS_DIR}/sample.out" \
@@ -1,6 +1,8 @@
 import argparse
 import contextlib
 import io
+import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -12,10 +14,18 @@ from pages_cli import (
     add_dump_args,
     add_filter_args,
     emit_db_warnings,
+    flush_messages,
+    info_count,
+    load_dump,
     load_focus_entries,
+    map_jobs,
     parse_dump_check,
+    pool_size,
     resolve_filter_args,
+    resolve_strict,
+    validate_jobs,
     validate_limits,
+    warn,
 )
 from pages_db import ParseResult, ParseStats
 
@@ -116,6 +126,35 @@ class TestPagesCLI(unittest.TestCase):
         self.assertFalse(ok)
         self.assertIn("--bytes must be 0 or a positive integer", stderr.getvalue())
 
+    def test_jobs_negative(self) -> None:
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            ok = validate_jobs(-1)
+        self.assertFalse(ok)
+        self.assertIn("--jobs must be 0 or a positive integer", stderr.getvalue())
+        self.assertTrue(validate_jobs(0))
+
+    def test_jobs_too_many(self) -> None:
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            ok = validate_jobs(10000 * (os.cpu_count() or 1))
+        self.assertFalse(ok)
+        self.assertIn("--jobs must be at most", stderr.getvalue())
+        self.assertTrue(validate_jobs(os.cpu_count() or 1))
+
+    def test_map_jobs_keeps_order(self) -> None:
+        tasks = ["a", "b", "c"]
+        with map_jobs(str.upper, tasks, 1) as results:
+            self.assertEqual(list(results), ["A", "B", "C"])
+        with map_jobs(str.upper, tasks, 2) as results:
+            self.assertEqual(list(results), ["A", "B", "C"])
+
+    def test_pool_size_capped_by_tasks(self) -> None:
+        self.assertEqual(pool_size(10000, 3), 3)
+        self.assertEqual(pool_size(2, 40), 2)
+        self.assertLessEqual(pool_size(0, 2), 2)
+        self.assertEqual(pool_size(4, 0), 1)
+
     def test_focus_entries_missing(self) -> None:
         stderr = io.StringIO()
         with contextlib.redirect_stderr(stderr):
@@ -176,6 +215,42 @@ class TestPagesCLI(unittest.TestCase):
             self.assertIsNone(result)
             self.assertIn("Empty input file", stderr.getvalue())
 
+    def test_resolve_strict(self) -> None:
+        parser = argparse.ArgumentParser(add_help=False)
+        add_common_args(
+            parser,
+            prefix_default=None,
+            case_default=None,
+            prefix_help="prefix help",
+            case_help="case help",
+        )
+        cases = [
+            ([], (True, True)),
+            (["--permit-header"], (False, True)),
+            (["--permit-columns"], (True, False)),
+            (["--permit"], (False, False)),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                self.assertEqual(resolve_strict(parser.parse_args(argv)), expected)
+
+    def test_load_dump_missing_input(self) -> None:
+        parser = argparse.ArgumentParser(add_help=False)
+        add_common_args(
+            parser,
+            prefix_default=None,
+            case_default=None,
+            prefix_help="prefix help",
+            case_help="case help",
+        )
+        add_dump_args(parser)
+        args = parser.parse_args(["--input", "missing.out"])
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            result = load_dump(args, include_content=False)
+        self.assertIsNone(result)
+        self.assertIn("input file not found: missing.out", stderr.getvalue())
+
     def test_db_warnings_strict(self) -> None:
         stats = ParseStats(
             skipped_malformed=2,
@@ -222,6 +297,53 @@ class TestPagesCLI(unittest.TestCase):
         self.assertIn("Header error in", output)
         self.assertIn("Invalid id count: 1", output)
 
+    def test_db_warnings_clean(self) -> None:
+        result = ParseResult(rows=[], stats=ParseStats(read_lines=3))
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            emit_db_warnings(
+                result,
+                Path("db.out"),
+                strict_header=False,
+                strict_columns=False,
+            )
+        self.assertEqual(stderr.getvalue(), "")
+
+    def test_db_warnings_json(self) -> None:
+        stats = ParseStats(read_lines=4, skipped_oversized=1, reached_limit=True)
+        result = ParseResult(rows=[], stats=stats)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            emit_db_warnings(
+                result,
+                Path("db.out"),
+                strict_header=True,
+                strict_columns=True,
+                json_warnings=True,
+            )
+        report = json.loads(stderr.getvalue())
+        self.assertEqual(report["input"], "db.out")
+        self.assertEqual(report["read_lines"], 4)
+        self.assertEqual(report["oversized"], 1)
+        self.assertTrue(report["reached_limit"])
+        self.assertEqual(report["invalid_date"], 0)
+
+    def test_messages_buffered_until_flush(self) -> None:
+        messages: list[str] = []
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            info_count("Invalid id count", 2, path=Path("db.out"), messages=messages)
+            info_count("Duplicate id count", 0, messages=messages)
+            warn("Line limit reached at line 3.", messages=messages)
+            self.assertEqual(stderr.getvalue(), "")
+            flush_messages(messages)
+        self.assertEqual(
+            stderr.getvalue(),
+            "Info: Invalid id count: 2 in db.out\n"
+            "Warning: Line limit reached at line 3.\n",
+        )
+        self.assertEqual(messages, [])
+
 
 if __name__ == "__main__":
     run_main()
@@ -2,7 +2,14 @@ import unittest
 
 from test_pages import run_main
 
-from pages_content import clean_content, clean_md, _structure_warnings
+from pages_content import (
+    clean_content,
+    clean_md,
+    _drop_list_blank_lines,
+    _parse_attrs,
+    _structure_warnings,
+    _unescape_cached,
+)
 from pages_util import FilterCounts, SanitizeCounts
 
 
@@ -21,6 +28,26 @@ class TestPagesContent(unittest.TestCase):
             'Link (https://example.com "Site")\n',
         )
 
+    def test_drop_list_blank_lines_runs(self) -> None:
+        lines = ["- a", "", "  ", "- b", "", "text", "", "", "- c"]
+        self.assertEqual(
+            _drop_list_blank_lines(lines),
+            ["- a", "- b", "", "text", "", "", "- c"],
+        )
+        lines = ["1. a"] + [""] * 5000 + ["2. b"]
+        self.assertEqual(_drop_list_blank_lines(lines), ["1. a", "2. b"])
+
+    def test_parse_attrs_quoting(self) -> None:
+        tag = '<a HREF = "x.html" title=\'T\' rel=nofollow>'
+        self.assertEqual(
+            _parse_attrs(tag), {"href": "x.html", "title": "T", "rel": "nofollow"}
+        )
+        tag = '<a data-href="d" title="href=v" href="a" href="b">'
+        attrs = _parse_attrs(tag)
+        self.assertEqual(attrs["href"], "a")
+        self.assertEqual(attrs["data-href"], "d")
+        self.assertEqual(attrs["title"], "href=v")
+
     def test_clean_content_link_blocked_scheme(self) -> None:
         text = '<a href="javascript:alert(1)">Link</a>'
         self.assertEqual(
@@ -69,6 +96,20 @@ class TestPagesContent(unittest.TestCase):
             "One (https://x) Two (https://y)\n",
         )
 
+    def test_clean_content_anchor_unclosed_tail(self) -> None:
+        text = '<A href="https://x">One</A> <a href="https://y">Two'
+        self.assertEqual(
+            clean_content(text, table_delim=",", replace_char=""),
+            "One (https://x) Two\n",
+        )
+
+    def test_clean_content_anchor_cache_short_values(self) -> None:
+        _unescape_cached.cache_clear()
+        long_alt = "a&amp;b " * 100
+        text = f'<a href="https://x">{"word " * 100}</a><img src="i.png" alt="{long_alt}">'
+        clean_md(text, replace_char="")
+        self.assertLessEqual(_unescape_cached.cache_info().currsize, 3)
+
     def test_clean_content_anchor_image_adjacent_text(self) -> None:
         text = '<a href="//example.com"><img src="logo.png" alt="Logo"></a>Next'
         self.assertEqual(
@@ -114,6 +155,13 @@ class TestPagesContent(unittest.TestCase):
             "1. One\n2. Two\n",
         )
 
+    def test_clean_content_ordered_list_unclosed_tail(self) -> None:
+        text = "<ol><li>One</li></OL ><ol><li>Two"
+        self.assertEqual(
+            clean_content(text, table_delim=",", replace_char=""),
+            "1. One\n- Two\n",
+        )
+
     def test_clean_content_table(self) -> None:
         text = "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>"
         self.assertEqual(
@@ -238,6 +286,19 @@ class TestPagesContent(unittest.TestCase):
         self.assertIn("&amp;", seen[0])
         self.assertNotIn("<", seen[0])
 
+    def test_clean_content_blank_row(self) -> None:
+        seen: list[str] = []
+        counts = FilterCounts()
+        self.assertEqual(
+            clean_md(" \n ", replace_char="", notags_sink=seen.append, filter_counts=counts),
+            "",
+        )
+        self.assertEqual(seen, [" \n "])
+        clean_content(
+            " \n", table_delim=",", replace_char="", keep_newlines=False, filter_counts=counts
+        )
+        self.assertEqual(counts.re_nl, 1)
+
     def test_clean_content_nested_lists(self) -> None:
         text = "<ul><li>One<ul><li>Sub</li></ul></li><li>Two</li></ul>"
         self.assertEqual(
@@ -11,6 +11,7 @@ from pages_db import (
     build_title_index,
     parse_dump,
     pick_best,
+    read_buffer_size,
 )
 
 
@@ -22,6 +23,7 @@ class TestPagesDB(unittest.TestCase):
         self.assertEqual(result.stats.skipped_malformed, 0)
         self.assertEqual(result.stats.skipped_oversized, 0)
         self.assertFalse(result.stats.reached_limit)
+        self.assertTrue(result.stats.is_clean())
         first = result.rows[0]
         self.assertEqual(first.id, "1")
         self.assertEqual(first.title, "Home")
@@ -98,6 +100,7 @@ class TestPagesDB(unittest.TestCase):
         self.assertEqual(result.rows[1].id, "2")
         self.assertEqual(result.stats.read_lines, 2)
         self.assertTrue(result.stats.reached_limit)
+        self.assertFalse(result.stats.is_clean())
 
     def test_limits_max_bytes(self) -> None:
         result = parse_dump(
@@ -121,6 +124,29 @@ class TestPagesDB(unittest.TestCase):
             self.assertEqual(result.stats.unknown_status_count, 1)
             self.assertEqual(result.stats.invalid_date_count, 1)
 
+    def test_date_validation_shapes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "dates.out"
+            dates = [
+                "2024-02-29",
+                "2023-02-29",
+                "2023-01-01 23:59:59",
+                "2023-01-01 24:00:00",
+                "2023-1-5 1:2:3",
+                "2023/01/01",
+            ]
+            lines = ["id\tpost_title\tpost_content\tpost_status\tpost_date"]
+            lines += [f"{i}\tT{i}\tBody\tpublish\t{date}" for i, date in enumerate(dates, 1)]
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            result = parse_dump(path)
+            self.assertEqual(result.stats.invalid_date_count, 3)
+
+    def test_read_buffer_size(self) -> None:
+        self.assertEqual(read_buffer_size(0), 1024 * 1024)
+        self.assertEqual(read_buffer_size(100), 64 * 1024)
+        self.assertEqual(read_buffer_size(200_000), 200_000)
+        self.assertEqual(read_buffer_size(5_000_000), 1024 * 1024)
+
     def test_use_csv_parsing(self) -> None:
         result = parse_dump(TESTS_DIR / "sample.out", use_csv=True)
         self.assertEqual(len(result.rows), 8)
@@ -209,6 +235,12 @@ class TestPagesDB(unittest.TestCase):
         self.assertEqual(result.rows[0].content, "")
         self.assertEqual(result.rows[0].content_bytes, 12)
 
+    def test_keep_content_filter(self) -> None:
+        result = parse_dump(TESTS_DIR / "sample.out", keep_content=lambda title: title == "About")
+        kept = {row.title: row.content for row in result.rows if row.content}
+        self.assertEqual(kept, {"About": "About content"})
+        self.assertEqual(result.rows[0].content_bytes, 12)
+
     def test_duplicate_id_count(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             path = Path(tmp) / "duplicate_id.out"
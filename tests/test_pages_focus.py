@@ -7,11 +7,15 @@ from test_pages import TESTS_DIR, run_main
 from pages_db import build_title_index, parse_dump
 from pages_focus import (
     FocusEntry,
+    build_focus_index,
+    build_prefix_index,
     build_rows_keys,
+    content_filter,
     load_focus_list,
     match_entries,
     match_focus_entry,
     match_label,
+    prefix_rows,
 )
 
 class TestPagesFocus(unittest.TestCase):
@@ -33,6 +37,15 @@ class TestPagesFocus(unittest.TestCase):
             self.assertEqual([entry.key for entry in result.entries], ["Home", "home"])
             self.assertEqual(result.duplicates, [])
 
+    def test_content_filter(self) -> None:
+        entries = [FocusEntry(name="About", key="about", key_len=5)]
+        keep = content_filter(entries, case_sensitive=False, use_prefix=False)
+        self.assertTrue(keep("ABOUT"))
+        self.assertFalse(keep("About Us"))
+        keep = content_filter(entries, case_sensitive=False, use_prefix=True)
+        self.assertTrue(keep("About Us"))
+        self.assertFalse(keep("Home"))
+
     def test_rowkeys_nocase(self) -> None:
         rows = parse_dump(TESTS_DIR / "sample.out").rows
         rows_with_keys = build_rows_keys(rows, case_sensitive=False)
@@ -40,6 +53,14 @@ class TestPagesFocus(unittest.TestCase):
         self.assertEqual(rows_with_keys[0][0], "home")
         self.assertEqual(rows_with_keys[0][1].title, "Home")
 
+    def test_prefix_rows_keep_row_order(self) -> None:
+        rows = parse_dump(TESTS_DIR / "sample.out").rows
+        rows_with_keys = build_rows_keys(rows, case_sensitive=False)
+        prefix_index = build_prefix_index(rows_with_keys)
+        expected = [row for row in rows if row.title.lower().startswith("a")]
+        self.assertEqual(prefix_rows("a", rows_with_keys, prefix_index), expected)
+        self.assertEqual(prefix_rows("zz", rows_with_keys, prefix_index), [])
+
     def test_focusmatch_exact_best(self) -> None:
         rows = parse_dump(TESTS_DIR / "sample.out").rows
         title_index = build_title_index(rows, case_sensitive=True)
@@ -85,6 +106,15 @@ class TestPagesFocus(unittest.TestCase):
         label, focus = match_label(row, entries, case_sensitive=True, use_prefix=True)
         self.assertEqual(label, "prefix")
         self.assertEqual(focus, "Contac")
+        focus_index = build_focus_index(entries)
+        self.assertEqual(
+            match_label(row, entries, True, True, focus_index=focus_index),
+            ("prefix", "Contac"),
+        )
+        self.assertEqual(
+            match_label(row, entries, True, False, focus_index=focus_index),
+            ("none", ""),
+        )
 
     def test_match_entries_mixed(self) -> None:
         rows = parse_dump(TESTS_DIR / "sample.out").rows
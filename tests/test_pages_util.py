@@ -1,3 +1,4 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -116,6 +117,15 @@ class TestPagesUtil(unittest.TestCase):
         self.assertEqual(counts.re_non_ascii, 1)
         self.assertEqual(counts.rep_chars, 4)
 
+    def test_filter_characters_mixed_run(self) -> None:
+        counts = FilterCounts()
+        text = "A\x01\u200b\u00e9\x7fB"
+        self.assertEqual(filter_characters(text, "?", counts=counts), "A?e?B")
+        self.assertEqual(counts.re_control, 2)
+        self.assertEqual(counts.re_zero, 1)
+        self.assertEqual(counts.re_non_ascii, 1)
+        self.assertEqual(counts.rep_chars, 2)
+
     def test_prepare_output_dir_existing_file(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             path = Path(tmp) / "output.txt"
@@ -145,6 +155,14 @@ class TestPagesUtil(unittest.TestCase):
                 write_text_check(path, "x")
             self.assertIn("output file could not be written", str(raised.exception))
 
+    def test_write_text_check_encoding(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "file.txt"
+            write_text_check(path, "Caf\u00e9\n", encoding="ascii", errors="ignore")
+            self.assertEqual(path.read_bytes(), ("Caf" + os.linesep).encode("ascii"))
+            write_text_check(path, "Caf\u00e9")
+            self.assertEqual(path.read_text(encoding="utf-8"), "Caf\u00e9")
+
     def test_write_bytes_check_dir_path(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             path = Path(tmp) / "dir_path"